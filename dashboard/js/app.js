@@ -144,6 +144,19 @@ async function loadData() {
             };
         } else {
             DATA = await response.json();
+
+            // aggregated.json may be an index into an NDJSON file (one scrape per line)
+            if (DATA.data_file) {
+                const ndjsonResponse = await fetch(`../data/scrapes/${DATA.data_file}`);
+                if (!ndjsonResponse.ok) {
+                    throw new Error(`Could not load ${DATA.data_file}`);
+                }
+                const text = await ndjsonResponse.text();
+                DATA.scrapes = text
+                    .split('\n')
+                    .filter(line => line.trim())
+                    .map(line => JSON.parse(line));
+            }
         }
 
         // Update data freshness indicator
@@ -6,26 +6,55 @@ Scrapes hotel rates from Booking.com for FIFA 2026 World Cup dates
 in Toronto and Vancouver.
 """
 
+import argparse
+import asyncio
+import atexit
+import contextvars
+import hashlib
+import html
 import json
 import logging
 import os
+import queue
 import random
 import re
+import shutil
 import sys
 import time
 import traceback
 import warnings
-from collections import Counter
-from datetime import datetime, timedelta, timezone
-from logging.handlers import RotatingFileHandler
+import weakref
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache, wraps
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from urllib.parse import quote_plus
+from typing import Iterator
+from urllib.parse import quote_plus, urlsplit
 
 # Suppress deprecation warning from playwright_stealth's use of pkg_resources
 warnings.filterwarnings("ignore", message="pkg_resources is deprecated")
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-from playwright_stealth import stealth_sync
+import httpx
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from playwright_stealth import StealthConfig
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
 
 
 class BrowserCorruptionError(Exception):
@@ -33,27 +62,33 @@ class BrowserCorruptionError(Exception):
     pass
 
 
-def is_browser_corruption_error(error: Exception) -> bool:
-    """Check if an exception indicates browser/context corruption."""
-    error_str = str(error).lower()
-    error_type = type(error).__name__
-
-    corruption_indicators = [
-        "'dict' object has no attribute '_object'",
-        "object has been collected",
-        "target page, context or browser has been closed",
-        "browser has been closed",
-        "context has been closed",
-        "page has been closed",
-        "connection closed",
-        "target closed",
-    ]
+class BrowserRequiredError(Exception):
+    """Raised when a lookup run without a page needs the browser to finish."""
+    pass
 
-    for indicator in corruption_indicators:
-        if indicator.lower() in error_str.lower():
-            return True
 
-    return False
+class BookingBotCheckError(Exception):
+    """Raised when a Booking.com API request is answered with a bot challenge."""
+    pass
+
+
+# Error message fragments that mean the browser/context is unusable
+CORRUPTION_INDICATORS = [
+    "'dict' object has no attribute '_object'",
+    "object has been collected",
+    "target page, context or browser has been closed",
+    "browser has been closed",
+    "context has been closed",
+    "page has been closed",
+    "connection closed",
+    "target closed",
+]
+_CORRUPTION_RE = re.compile("|".join(re.escape(s) for s in CORRUPTION_INDICATORS), re.I)
+
+
+def is_browser_corruption_error(error: Exception) -> bool:
+    """Check if an exception indicates browser/context corruption."""
+    return bool(_CORRUPTION_RE.search(str(error)))
 
 
 # Segment-based price sanity thresholds (per night, in CAD)
@@ -114,12 +149,128 @@ def sanity_check_rate(rate: int, segment: str, hotel_name: str) -> dict:
     return {"valid": True, "flag": None, "reason": None}
 
 
+UTC = timezone.utc
+
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
 CONFIG_PATH = PROJECT_ROOT / "config" / "hotels.json"
+# Captured Booking.com SearchQueries document; the API path is skipped without it
+BOOKING_GRAPHQL_QUERY_PATH = PROJECT_ROOT / "config" / "booking_search.graphql"
+# Captured AvailabilityCalendar document; enables one request per hotel per window
+BOOKING_CALENDAR_QUERY_PATH = PROJECT_ROOT / "config" / "booking_calendar.graphql"
 DATA_DIR = PROJECT_ROOT / "data" / "scrapes"
+AGGREGATED_NDJSON_NAME = "aggregated.ndjson"
+# Append-only resume checkpoints (DATA_DIR/checkpoints/<scrape timestamp>.ndjson)
+CHECKPOINT_DIR_NAME = "checkpoints"
+SCRAPE_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+DATE_DIR_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+# Below this many new scrape files, parsing in-process beats starting workers
+AGGREGATE_PARALLEL_MIN_FILES = 16
 LOG_DIR = SCRIPT_DIR / "logs"
+# Cookies/localStorage carried between runs so contexts start with a warm session
+BROWSER_STATE_PATH = SCRIPT_DIR / "browser_state.json"
+
+# Booking.com endpoints
+BOOKING_HOME_URL = "https://www.booking.com/"
+BOOKING_HOST = urlsplit(BOOKING_HOME_URL).hostname
+BOOKING_GRAPHQL_URL = "https://www.booking.com/dml/graphql"
+BOOKING_AUTOCOMPLETE_URL = "https://accommodations.booking.com/autocomplete.json"
+# Days of single-night availability requested per calendar call
+CALENDAR_WINDOW_DAYS = 31
+
+# Booking.com result page selectors and text patterns
+PROPERTY_CARD_SELECTOR = '[data-testid="property-card"]'
+RESULTS_READY_SELECTOR = '[data-testid="property-card"], [data-testid="no-results"]'
+# Tried in order: <main> contains the other two, so it's only the fallback
+AVAILABILITY_SCOPE_SELECTORS = ('[data-testid="availability-container"]', '[data-testid="no-results"]', 'main')
+CAD_PRICE_RE = re.compile(r'(?:CA\$|CAD|C\$)\s*([\d,]+)')
+WORD_RE = re.compile(r'\w+')
+# The hotel name sits in the card title, so only the start of a card is matched
+CARD_HEADER_CHARS = 400
+SOLD_OUT_RE = re.compile(r'(no availability|unavailable|this property is unavailable)')
+
+# Fallback card extraction from raw HTML when selectolax isn't installed
+PROPERTY_CARD_SPLIT_RE = re.compile(r'<div[^>]*data-testid="property-card"[^>]*>')
+SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b.*?</\1>', re.S | re.I)
+# Markup the browser hides or strikes through: struck-out and screen-reader-only prices
+HIDDEN_PRICE_SELECTOR = 's, del, [aria-hidden="true"], .bui-u-sr-only'
+HIDDEN_PRICE_RE = re.compile(r'<(s|del)\b.*?</\1>|<span[^>]*(?:aria-hidden="true"|bui-u-sr-only)[^>]*>.*?</span>', re.S | re.I)
+DIV_TAG_RE = re.compile(r'<(/?)div\b', re.I)
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Requests aborted in every context. Prices are rendered as text, so none of
+# these affect extraction. Stylesheets are kept: innerText depends on CSS
+# visibility, and unstyled cards expose hidden prices to the price scan.
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "texttrack", "manifest"}
+# Third-party tags plus Booking.com's own c360 event collector
+BLOCKED_URL_PATTERNS = (
+    "googletagmanager", "google-analytics", "doubleclick",
+    "connect.facebook.net", "bat.bing.com", "hotjar", "/c360/",
+)
+BLOCKED_URL_RE = re.compile("|".join(re.escape(p) for p in BLOCKED_URL_PATTERNS))
+
+# Bounds on browser restarts so a wedged Chromium can't stall recovery
+BROWSER_LAUNCH_TIMEOUT_SECONDS = 15
+BROWSER_CLOSE_TIMEOUT_SECONDS = 5
+
+# Page timeouts (ms). Results render within a few seconds of domcontentloaded,
+# so a slower page is retried rather than waited on
+NAVIGATION_TIMEOUT_MS = 30000
+RESULTS_TIMEOUT_MS = 8000
+
+# Exponential retry back-off: base * 2**attempt seconds, capped, plus jitter
+RETRY_BACKOFF_CAP_SECONDS = 30
+RETRY_JITTER_SECONDS = 0.5
+
+# Only the evasions Booking.com's bot checks probe (webdriver flag, languages,
+# plugins, chrome.runtime); the rest just add init-script work to every page.
+# Joined into one script installed per context, so extra tabs inherit it.
+STEALTH_CONFIG = StealthConfig(
+    webgl_vendor=False,
+    chrome_app=False,
+    chrome_csi=False,
+    chrome_load_times=False,
+    iframe_content_window=False,
+    media_codecs=False,
+    navigator_hardware_concurrency=0,
+    navigator_permissions=False,
+    navigator_platform=False,
+    navigator_user_agent=False,
+    navigator_vendor=False,
+    outerdimensions=False,
+    hairline=False,
+    languages=("en-CA", "en"),
+)
+STEALTH_INIT_SCRIPT = ";\n".join(STEALTH_CONFIG.enabled_scripts)
+
+# Contexts whose cookie banner has already been handled (or never appeared)
+_consent_checked_contexts = weakref.WeakSet()
+
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Autocomplete results per search string (destinations don't change mid-run)
+_destination_cache = {}
+
+# Serializes the API session warm-up across concurrent workers
+_csrf_lock = asyncio.Lock()
+
+# Rate response cache (Redis if configured, in-process otherwise)
+REDIS_URL_ENV = "PITCHPRICE_REDIS_URL"
+RATE_CACHE_TTL_SECONDS = 6 * 60 * 60
+RATE_CACHEABLE_STATUSES = {"available", "sold_out"}
+_redis_client = None
+_redis_unavailable = False
+_local_rate_cache = OrderedDict()
+# Lookups in progress, so concurrent tasks needing the same stay share one fetch
+_inflight_rates = {}
+
+# GraphQL search tried first; set per run when a query has been captured
+# and switched off after the first bot check
+_graphql_api = False
+# Server-rendered results page tried before the browser; set per run from
+# scrape_settings.html_fast_path and switched off after the first bot check
+_html_fast_path = False
 
 # Ensure log directory exists
 LOG_DIR.mkdir(exist_ok=True)
@@ -148,16 +299,89 @@ console_formatter = logging.Formatter(
 )
 console_handler.setFormatter(console_formatter)
 
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+# Hand records to a background listener thread so log calls from the
+# scrape workers never block on disk or console I/O
+log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(
+    log_queue, file_handler, console_handler, respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
 
 
-def load_config():
-    """Load the hotels configuration file."""
-    with open(CONFIG_PATH, "r") as f:
+def read_json(path: Path):
+    """Load a JSON file, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r") as f:
         return json.load(f)
 
 
+def write_json(path: Path, data, indent: bool = True):
+    """Write data as JSON, using orjson when it's installed."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        path.write_bytes(orjson.dumps(data, option=option))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2 if indent else None)
+
+
+def _dumps_pretty(data) -> str:
+    """Serialize data with a 2-space indent, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def write_scrape_file(path: Path, scrape_metadata: dict, results, errors: list, report: dict):
+    """
+    Write a scrape file, streaming the results one at a time.
+
+    Produces the same indented layout as write_json on the full dict, without
+    holding every result in memory.
+    """
+    with open(path, "w") as f:
+        f.write('{\n  "scrape_metadata": ')
+        f.write(_dumps_pretty(scrape_metadata).replace("\n", "\n  "))
+        f.write(',\n  "results": [')
+        first = True
+        for result in results:
+            f.write("\n    " if first else ",\n    ")
+            f.write(_dumps_pretty(result).replace("\n", "\n    "))
+            first = False
+        f.write("]" if first else "\n  ]")
+        f.write(',\n  "errors": ')
+        f.write(_dumps_pretty(errors).replace("\n", "\n  "))
+        f.write(',\n  "report": ')
+        f.write(_dumps_pretty(report).replace("\n", "\n  "))
+        f.write("\n}")
+
+
+def _dumps_compact(data) -> bytes:
+    """Serialize data without whitespace, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def json_line(data) -> bytes:
+    """Serialize data as one compact NDJSON line."""
+    return _dumps_compact(data) + b"\n"
+
+
+def _loads_line(line: bytes):
+    """Parse one NDJSON line, using orjson when it's installed."""
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+
+@lru_cache(maxsize=1)
+def load_config():
+    """Load the hotels configuration file (parsed once per process)."""
+    return read_json(CONFIG_PATH)
+
+
 def get_event_cities(config: dict, event_id: str = "fifa_2026") -> dict:
     """
     Get cities configuration for an event.
@@ -197,6 +421,23 @@ def get_event_info(config: dict, event_id: str = "fifa_2026") -> dict:
     }
 
 
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix."""
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+@lru_cache(maxsize=1024)
+def _parse_ymd(date_str: str) -> date:
+    """Parse a YYYY-MM-DD string, memoized since the same dates recur all run."""
+    return date.fromisoformat(date_str)
+
+
+@lru_cache(maxsize=1024)
+def day_after(date_str: str) -> str:
+    """Return the YYYY-MM-DD date after date_str (the check-out for a 1-night stay)."""
+    return (_parse_ymd(date_str) + timedelta(days=1)).isoformat()
+
+
 def calculate_days_to_event(check_in_date: str, event_dates: list) -> dict:
     """
     Calculate days to nearest event date.
@@ -211,15 +452,14 @@ def calculate_days_to_event(check_in_date: str, event_dates: list) -> dict:
     if not event_dates:
         return {"days_to_event": None, "nearest_event_date": None}
 
-    check_in = datetime.strptime(check_in_date, "%Y-%m-%d")
+    check_in = _parse_ymd(check_in_date)
 
     # Find the nearest event date
     nearest = None
     min_days = float('inf')
 
     for event_date in event_dates:
-        event_dt = datetime.strptime(event_date, "%Y-%m-%d")
-        days = (event_dt - check_in).days
+        days = (_parse_ymd(event_date) - check_in).days
         if abs(days) < abs(min_days):
             min_days = days
             nearest = event_date
@@ -230,18 +470,26 @@ def calculate_days_to_event(check_in_date: str, event_dates: list) -> dict:
     }
 
 
-def generate_dates(start_date: str, end_date: str) -> list[str]:
-    """Generate list of dates between start and end (inclusive)."""
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    dates = []
-    current = start
-    while current <= end:
-        dates.append(current.strftime("%Y-%m-%d"))
-        current += timedelta(days=1)
-    return dates
+def generate_dates(start_date: str, end_date: str) -> Iterator[str]:
+    """Yield YYYY-MM-DD dates between start and end (inclusive)."""
+    first = date.fromisoformat(start_date).toordinal()
+    last = date.fromisoformat(end_date).toordinal()
+    for ordinal in range(first, last + 1):
+        yield date.fromordinal(ordinal).isoformat()
+
+
+@lru_cache(maxsize=None)
+def _dates_between(start_date: str, end_date: str) -> tuple[str, ...]:
+    """Cached generate_dates; cities sharing an event window share one tuple."""
+    return tuple(generate_dates(start_date, end_date))
+
+
+def _date_range(city_config: dict) -> dict:
+    """Return a city's scrape date range, supporting the legacy date_range key."""
+    return city_config.get("scrape_date_range") or city_config.get("date_range") or {}
 
 
+@lru_cache(maxsize=8192)
 def build_booking_url(hotel_name: str, city: str, check_in: str, check_out: str) -> str:
     """
     Build a Booking.com search URL for a specific hotel and date.
@@ -272,8 +520,516 @@ def build_booking_url(hotel_name: str, city: str, check_in: str, check_out: str)
     return url
 
 
-def dismiss_cookie_popup(page):
-    """Dismiss Booking.com cookie consent popup if present."""
+@lru_cache(maxsize=None)
+def hotel_key_words(hotel_name: str) -> frozenset[str]:
+    """Get the (up to 3) distinctive words used to match a hotel in search results."""
+    return frozenset([w for w in WORD_RE.findall(hotel_name.lower()) if len(w) > 3][:3])
+
+
+def card_match_score(key_words: frozenset[str], card_text: str) -> int:
+    """Count a hotel's key words in the title area at the top of a result card."""
+    header = card_text[:CARD_HEADER_CHARS].lower()
+    return len(key_words.intersection(WORD_RE.findall(header)))
+
+
+@lru_cache(maxsize=1)
+def load_booking_graphql_query() -> str | None:
+    """Load the captured SearchQueries GraphQL document, or None if not captured."""
+    if not BOOKING_GRAPHQL_QUERY_PATH.exists():
+        return None
+    return BOOKING_GRAPHQL_QUERY_PATH.read_text()
+
+
+@lru_cache(maxsize=1)
+def load_booking_calendar_query() -> str | None:
+    """Load the captured AvailabilityCalendar GraphQL document, or None if not captured."""
+    if not BOOKING_CALENDAR_QUERY_PATH.exists():
+        return None
+    return BOOKING_CALENDAR_QUERY_PATH.read_text()
+
+
+def backoff_delay(attempt: int, base: float) -> float:
+    """
+    Seconds to wait before a retry, doubling with each attempt.
+
+    Args:
+        attempt: Number of attempts already made (or retry index from 0)
+        base: Delay for attempt 0
+
+    Returns:
+        base * 2**attempt capped at RETRY_BACKOFF_CAP_SECONDS, plus random
+        jitter so concurrent workers don't retry in lockstep
+    """
+    return min(RETRY_BACKOFF_CAP_SECONDS, base * 2 ** attempt) + random.uniform(0, RETRY_JITTER_SECONDS)
+
+
+# Hosts whose next slot the current task has already waited for (see
+# HostLimiter.reserved); a mutable set so tasks spawned by gather share it
+_held_slots = contextvars.ContextVar("held_slots", default=None)
+
+
+class HostLimiter:
+    """
+    Spaces out requests to each host by a random gap that adapts to load.
+
+    Callers reserve the host's next free slot and sleep until it, so one host
+    sees at most one request per gap however many workers are running, while
+    different hosts never wait on each other. Each 429/503 doubles that host's
+    gap (up to 2**max_pressure) and each success halves it back toward the
+    configured range; a Retry-After pushes the host's next slot back.
+    Browser tasks reserve their slot before taking a context, so workers
+    queue here instead of holding idle contexts.
+    """
+
+    THROTTLE_STATUSES = (429, 503)
+
+    def __init__(self, min_gap: float = 0.0, max_gap: float = 0.0, max_pressure: int = 5):
+        self.min_gap = min_gap
+        self.max_gap = max_gap
+        self.max_pressure = max_pressure
+        self.next_ok = defaultdict(float)
+        self.pressure = defaultdict(int)
+
+    async def wait(self, host: str):
+        """Sleep until this host's next request slot, or spend one this task reserved."""
+        held = _held_slots.get()
+        if held is not None and host in held:
+            held.discard(host)
+            return
+        now = time.monotonic()
+        slot = max(now, self.next_ok[host])
+        gap = random.uniform(self.min_gap, self.max_gap) * 2 ** self.pressure[host]
+        self.next_ok[host] = slot + gap
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    @asynccontextmanager
+    async def reserved(self, host: str):
+        """Wait for host's next slot now and hold it for this task's next wait(host).
+
+        A slot that's never spent (e.g. the lookup was a cache hit) is dropped
+        on exit rather than letting a later request jump the queue.
+        """
+        await self.wait(host)
+        held = _held_slots.get()
+        if held is None:
+            held = set()
+            _held_slots.set(held)
+        held.add(host)
+        try:
+            yield
+        finally:
+            held.discard(host)
+
+    def record(self, host: str, status: int | None, headers):
+        """Adapt host's gap to a response status and honour its Retry-After (in seconds)."""
+        if status in self.THROTTLE_STATUSES:
+            if self.pressure[host] < self.max_pressure:
+                self.pressure[host] += 1
+                logger.warning(f"{host} throttled (HTTP {status}), spacing requests {2 ** self.pressure[host]}x")
+        elif status is not None and status < 400 and self.pressure[host] > 0:
+            self.pressure[host] -= 1
+
+        retry_after = (headers.get("retry-after") or "").strip()
+        if retry_after.isdigit():
+            seconds = int(retry_after)
+            self.next_ok[host] = max(self.next_ok[host], time.monotonic() + seconds)
+            logger.warning(f"{host} sent Retry-After {seconds}s, pausing requests to it")
+
+
+# Shared by the browser and API paths; gaps are set from scrape_settings per session
+host_limiter = HostLimiter()
+
+
+async def _pace_api_request(request: httpx.Request):
+    """httpx request hook: wait for the host's next slot."""
+    await host_limiter.wait(request.url.host)
+
+
+async def _note_api_response(response: httpx.Response):
+    """httpx response hook: pass the status and Retry-After back to the limiter."""
+    host_limiter.record(response.url.host, response.status_code, response.headers)
+
+
+def create_api_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client for Booking.com API requests."""
+    return httpx.AsyncClient(
+        http2=True,
+        event_hooks={"request": [_pace_api_request], "response": [_note_api_response]},
+        # Keep every pooled connection alive so bursts don't redo TLS handshakes
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        timeout=httpx.Timeout(30.0),
+        follow_redirects=True,
+        headers={
+            "User-Agent": BROWSER_USER_AGENT,
+            "Accept-Language": "en-CA,en;q=0.9",
+        },
+    )
+
+
+def check_api_response(response: httpx.Response, expect_json: bool = True):
+    """Raise BookingBotCheckError if a response is a bot challenge instead of data."""
+    if response.status_code in (202, 403, 405, 429):
+        raise BookingBotCheckError(f"HTTP {response.status_code} from {response.url.path}")
+
+    content_type = response.headers.get("content-type", "")
+    if expect_json and "json" not in content_type:
+        raise BookingBotCheckError(f"Non-JSON response ({content_type}) from {response.url.path}")
+
+    response.raise_for_status()
+
+
+async def ensure_csrf_token(client: httpx.AsyncClient):
+    """Warm up the client session and attach Booking.com's CSRF token to its headers."""
+    async with _csrf_lock:
+        if "x-booking-csrf-token" in client.headers:
+            return
+
+        response = await client.get(BOOKING_HOME_URL)
+        check_api_response(response, expect_json=False)
+
+        match = re.search(r"b_csrf_token:\s*'([^']+)'", response.text)
+        if not match:
+            raise BookingBotCheckError("No CSRF token on Booking.com home page")
+
+        client.headers["x-booking-csrf-token"] = match.group(1)
+
+
+async def lookup_booking_destination(client: httpx.AsyncClient, hotel_name: str, city: str) -> dict | None:
+    """
+    Resolve a hotel search string to a Booking.com destination via autocomplete.
+
+    Returns:
+        Dict with dest_id and dest_type, or None if autocomplete has no match
+    """
+    query = f"{hotel_name} {city}"
+    if query in _destination_cache:
+        return _destination_cache[query]
+
+    response = await client.post(
+        BOOKING_AUTOCOMPLETE_URL,
+        json={"query": query, "language": "en-gb", "size": 5},
+    )
+    check_api_response(response)
+
+    destination = None
+    try:
+        results = response.json().get("results", [])
+        if results:
+            destination = {
+                "dest_id": results[0]["dest_id"],
+                "dest_type": results[0]["dest_type"],
+            }
+    except (KeyError, IndexError, TypeError, AttributeError) as e:
+        raise ValueError(f"Unexpected autocomplete response shape: {type(e).__name__}: {e}") from e
+
+    _destination_cache[query] = destination
+    return destination
+
+
+async def fetch_booking_rate_api(client: httpx.AsyncClient, hotel_name: str, city: str, check_in: str, check_out: str) -> dict:
+    """
+    Fetch rate from Booking.com's internal GraphQL search API.
+
+    Raises BookingBotCheckError on a bot challenge and ValueError on an
+    autocomplete miss or a response that doesn't match the captured schema,
+    so callers can fall back to the browser.
+
+    Returns:
+        Dict with rate (TOTAL for the stay), currency, availability_status
+    """
+    query_document = load_booking_graphql_query()
+    if query_document is None:
+        raise ValueError(f"No GraphQL query captured at {BOOKING_GRAPHQL_QUERY_PATH}")
+
+    await ensure_csrf_token(client)
+
+    # An autocomplete miss isn't proof the hotel is gone; let the browser search
+    destination = await lookup_booking_destination(client, hotel_name, city)
+    if destination is None:
+        raise ValueError("Hotel not found in autocomplete")
+
+    try:
+        location = {
+            "searchString": f"{hotel_name} {city}",
+            "destId": int(destination["dest_id"]),
+            "destType": destination["dest_type"].upper(),
+        }
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Unexpected autocomplete destination shape: {type(e).__name__}: {e}") from e
+
+    payload = {
+        "operationName": "FullSearch",
+        "variables": {
+            "input": {
+                "dates": {"checkin": check_in, "checkout": check_out},
+                "location": location,
+                "nbAdults": 2,
+                "nbChildren": 0,
+                "nbRooms": 1,
+                "childrenAges": [],
+                "selectedFilters": "",
+            }
+        },
+        "query": query_document,
+    }
+
+    response = await client.post(
+        BOOKING_GRAPHQL_URL,
+        params={"lang": "en-gb", "selected_currency": "CAD"},
+        json=payload,
+        headers={
+            "x-booking-context-action-name": "searchresults_irene",
+            "Origin": BOOKING_HOME_URL.rstrip("/"),
+            "Referer": build_booking_url(hotel_name, city, check_in, check_out),
+        },
+    )
+    check_api_response(response)
+
+    try:
+        data = response.json().get("data") or {}
+        results = data["searchQueries"]["search"]["results"]
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Unexpected GraphQL response shape: {type(e).__name__}: {e}") from e
+
+    result = {
+        "rate": None,
+        "currency": "CAD",
+        "availability_status": "not_found",
+        "error": "Hotel not found in results"
+    }
+
+    key_words = hotel_key_words(hotel_name)
+
+    try:
+        for property_result in results:
+            display_name = (property_result.get("displayName") or {}).get("text") or ""
+            if card_match_score(key_words, display_name) < 2:
+                continue
+
+            amounts = [
+                block["finalPrice"]["amount"]
+                for block in property_result.get("blocks") or []
+                if block.get("finalPrice")
+            ]
+            if amounts:
+                result["rate"] = int(round(min(amounts)))
+                result["availability_status"] = "available"
+            else:
+                result["availability_status"] = "sold_out"
+            result["error"] = None
+            break
+    except (KeyError, IndexError, TypeError, AttributeError) as e:
+        raise ValueError(f"Unexpected GraphQL result shape: {type(e).__name__}: {e}") from e
+
+    return result
+
+
+def html_card_texts(markup: str, limit: int = 15) -> list[str]:
+    """
+    Extract the text of the first property cards from a results page's HTML.
+
+    Uses selectolax when it's installed, otherwise splits the markup on the
+    card element and strips tags. Struck-through and screen-reader-only
+    markup is dropped first, since the browser path never sees it as text.
+    CSS-hidden prices can still get through, which is why this path is off
+    by default.
+    """
+    if HTMLParser is not None:
+        tree = HTMLParser(markup)
+        cards = tree.css(PROPERTY_CARD_SELECTOR)[:limit]
+        for card in cards:
+            for hidden in card.css(HIDDEN_PRICE_SELECTOR):
+                hidden.decompose()
+        return [card.text(separator=" ") for card in cards]
+
+    markup = SCRIPT_STYLE_RE.sub(" ", markup)
+    markup = HIDDEN_PRICE_RE.sub(" ", markup)
+    chunks = PROPERTY_CARD_SPLIT_RE.split(markup)[1:limit + 1]
+    return [html.unescape(TAG_RE.sub(" ", _card_markup(chunk))) for chunk in chunks]
+
+
+def _card_markup(chunk: str) -> str:
+    """Cut markup following a card's opening tag at the card's closing </div>."""
+    depth = 0
+    for tag in DIV_TAG_RE.finditer(chunk):
+        if tag.group(1):
+            if depth == 0:
+                return chunk[:tag.start()]
+            depth -= 1
+        else:
+            depth += 1
+    return chunk
+
+
+async def fetch_booking_rate_html(client: httpx.AsyncClient, hotel_name: str, city: str, check_in: str, check_out: str) -> dict:
+    """
+    Fetch rate from the server-rendered search results page without a browser.
+
+    Only answers when the hotel's card is found; raises BookingBotCheckError
+    on a challenge page (or a page with no property cards) and ValueError if
+    the card can't be read, so callers can fall back to the browser.
+
+    Returns:
+        Dict with rate (TOTAL for the stay), currency, availability_status
+    """
+    response = await client.get(
+        build_booking_url(hotel_name, city, check_in, check_out),
+        headers={"Accept": "text/html,application/xhtml+xml"},
+    )
+    check_api_response(response, expect_json=False)
+
+    markup = response.text
+    if "px-captcha" in markup:
+        raise BookingBotCheckError("Captcha on search results page")
+
+    card_texts = html_card_texts(markup)
+    if not card_texts:
+        raise BookingBotCheckError("No property cards in search results HTML")
+
+    num_nights = (_parse_ymd(check_out) - _parse_ymd(check_in)).days
+    result = rate_from_card_texts(card_texts, hotel_name, num_nights)
+    if result["availability_status"] == "unknown":
+        raise ValueError(f"No readable card for {hotel_name} in search results HTML")
+    return result
+
+
+async def fetch_booking_calendar_api(client: httpx.AsyncClient, hotel_name: str, city: str, start: str, end: str) -> dict:
+    """
+    Fetch single-night availability for a range of dates in one request.
+
+    Uses the captured AvailabilityCalendar query. Days that are unavailable or
+    need a minimum stay come back as sold_out, which sends scrape_hotel_rate
+    straight to the multi-night calculation.
+
+    Raises BookingBotCheckError on a bot challenge and ValueError if the hotel
+    can't be resolved or the response doesn't match the captured schema.
+
+    Returns:
+        Dict mapping check-in date (YYYY-MM-DD) to a 1-night rate result
+    """
+    query_document = load_booking_calendar_query()
+    if query_document is None:
+        raise ValueError(f"No calendar query captured at {BOOKING_CALENDAR_QUERY_PATH}")
+
+    await ensure_csrf_token(client)
+
+    destination = await lookup_booking_destination(client, hotel_name, city)
+    if destination is None or destination["dest_type"].lower() != "hotel":
+        raise ValueError(f"Autocomplete has no hotel destination for {hotel_name}")
+
+    payload = {
+        "operationName": "AvailabilityCalendar",
+        "variables": {
+            "input": {
+                "destId": int(destination["dest_id"]),
+                "destType": "HOTEL",
+                "startDate": start,
+                "nbDays": (_parse_ymd(end) - _parse_ymd(start)).days + 1,
+                "nbAdults": 2,
+                "nbRooms": 1,
+                "currency": "CAD",
+            }
+        },
+        "query": query_document,
+    }
+
+    response = await client.post(
+        BOOKING_GRAPHQL_URL,
+        params={"lang": "en-gb", "selected_currency": "CAD"},
+        json=payload,
+        headers={
+            "x-booking-context-action-name": "hotel",
+            "Origin": BOOKING_HOME_URL.rstrip("/"),
+            "Referer": BOOKING_HOME_URL,
+        },
+    )
+    check_api_response(response)
+
+    data = response.json().get("data") or {}
+    try:
+        days = data["availabilityCalendar"]["days"]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Unexpected calendar response shape: missing {e}") from e
+
+    rates = {}
+    for day in days:
+        check_in = day.get("checkin")
+        if not check_in:
+            continue
+        if day.get("available") and (day.get("minLengthOfStay") or 1) <= 1:
+            if day.get("avgPriceRaw"):
+                rates[check_in] = {
+                    "rate": int(round(day["avgPriceRaw"])),
+                    "currency": "CAD",
+                    "availability_status": "available",
+                    "error": None
+                }
+        else:
+            rates[check_in] = {
+                "rate": None,
+                "currency": "CAD",
+                "availability_status": "sold_out",
+                "error": None
+            }
+    return rates
+
+
+async def prefetch_booking_calendar(client: httpx.AsyncClient, hotel_name: str, city_name: str, dates: list[str]) -> int:
+    """
+    Seed the rate cache with 1-night results from the availability calendar.
+
+    Makes one request per CALENDAR_WINDOW_DAYS dates, so the per-date lookups
+    that follow are cache hits. Stops quietly on the first failure; any dates
+    not seeded go through the normal API/browser path.
+
+    Returns:
+        Number of dates seeded
+    """
+    seeded = 0
+    for i in range(0, len(dates), CALENDAR_WINDOW_DAYS):
+        window = dates[i:i + CALENDAR_WINDOW_DAYS]
+        try:
+            rates = await fetch_booking_calendar_api(client, hotel_name, city_name, window[0], window[-1])
+        except BookingBotCheckError as e:
+            logger.warning(f"Calendar bot check for {hotel_name}, using per-date lookups: {e}")
+            break
+        except (httpx.HTTPError, ValueError, KeyError, TypeError, AttributeError) as e:
+            # A drifted calendar payload must not fail the tasks awaiting this prefetch
+            logger.warning(f"Calendar request failed for {hotel_name}, using per-date lookups: {type(e).__name__}: {e}")
+            break
+
+        for check_in in window:
+            if check_in in rates:
+                key = _rate_cache_key(hotel_name, city_name, check_in, day_after(check_in))
+                await store_cached_rate(key, rates[check_in])
+                seeded += 1
+
+    logger.debug(f"Calendar seeded {seeded}/{len(dates)} dates for {hotel_name}")
+    return seeded
+
+
+def consent_cookies() -> list[dict]:
+    """OneTrust cookie that marks the consent banner as already closed."""
+    return [{
+        "name": "OptanonAlertBoxClosed",
+        "value": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "domain": ".booking.com",
+        "path": "/",
+    }]
+
+
+async def dismiss_cookie_popup(page):
+    """
+    Dismiss Booking.com cookie consent popup if present.
+
+    Contexts start with the consent cookie set, so the banner normally never
+    shows; each context is checked once and later tabs skip the selectors.
+    """
+    if page.context in _consent_checked_contexts:
+        return False
+    _consent_checked_contexts.add(page.context)
+
     cookie_selectors = [
         'button:has-text("Accept")',
         'button:has-text("OK")',
@@ -283,60 +1039,65 @@ def dismiss_cookie_popup(page):
     for selector in cookie_selectors:
         try:
             btn = page.locator(selector).first
-            if btn.is_visible(timeout=2000):
-                btn.click()
-                time.sleep(0.5)
-                logger.debug(f"Dismissed cookie popup using selector: {selector}")
+            if await btn.is_visible(timeout=2000):
+                await btn.click()
+                await asyncio.sleep(0.5)
+                logger.debug("Dismissed cookie popup using selector: %s", selector)
                 return True
         except PlaywrightTimeout:
-            logger.debug(f"Cookie selector {selector} timed out")
+            logger.debug("Cookie selector %s timed out", selector)
             continue
         except Exception as e:
-            logger.debug(f"Cookie dismiss failed with {selector}: {type(e).__name__}: {e}")
+            logger.debug("Cookie dismiss failed with %s: %s: %s", selector, type(e).__name__, e)
             continue
     return False
 
 
-def capture_page_diagnostics(page, hotel_name: str, context: str) -> dict:
+async def capture_page_diagnostics(page, hotel_name: str, context: str) -> dict:
     """Capture diagnostic information from a page for debugging."""
     diagnostics = {
         "context": context,
         "hotel": hotel_name,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
     try:
-        diagnostics["page_title"] = page.title()
-    except Exception:
-        diagnostics["page_title"] = "Error getting title"
-
-    try:
-        diagnostics["page_url"] = page.url
-    except Exception:
-        diagnostics["page_url"] = "Error getting URL"
-
-    try:
-        property_cards = page.locator('[data-testid="property-card"]').count()
-        diagnostics["property_card_count"] = property_cards
-    except Exception:
-        diagnostics["property_card_count"] = -1
-
-    try:
-        page_text = page.inner_text("body", timeout=5000)
-        all_prices = re.findall(r'(?:CA\$|CAD|C\$)\s*([\d,]+)', page_text)
-        diagnostics["all_prices_found"] = [int(p.replace(',', '')) for p in all_prices[:20]]
-    except Exception:
-        diagnostics["all_prices_found"] = []
-
-    try:
-        body_text = page.inner_text("body", timeout=5000).lower()
-        diagnostics["has_no_availability"] = "no availability" in body_text
-        diagnostics["has_sold_out"] = "sold out" in body_text
-        diagnostics["has_captcha"] = "captcha" in body_text or "verify" in body_text
-    except Exception:
-        diagnostics["has_no_availability"] = None
-        diagnostics["has_sold_out"] = None
-        diagnostics["has_captcha"] = None
+        # One round-trip for everything; the body is serialized only once
+        snapshot = await page.evaluate(
+            """(selector) => ({
+                title: document.title,
+                url: location.href,
+                body: document.body ? document.body.innerText : "",
+                cardCount: document.querySelectorAll(selector).length,
+            })""",
+            PROPERTY_CARD_SELECTOR,
+        )
+    except Exception as e:
+        logger.debug(f"Could not capture page diagnostics: {type(e).__name__}: {e}")
+        diagnostics.update({
+            "page_title": "Error getting title",
+            "page_url": "Error getting URL",
+            "property_card_count": -1,
+            "all_prices_found": [],
+            "has_no_availability": None,
+            "has_sold_out": None,
+            "has_captcha": None,
+        })
+        return diagnostics
+
+    body_text = snapshot["body"]
+    body_lower = body_text.lower()
+    all_prices = CAD_PRICE_RE.findall(body_text)
+
+    diagnostics.update({
+        "page_title": snapshot["title"],
+        "page_url": snapshot["url"],
+        "property_card_count": snapshot["cardCount"],
+        "all_prices_found": [int(p.replace(',', '')) for p in all_prices[:20]],
+        "has_no_availability": "no availability" in body_lower,
+        "has_sold_out": "sold out" in body_lower,
+        "has_captcha": "captcha" in body_lower or "verify" in body_lower,
+    })
 
     return diagnostics
 
@@ -348,7 +1109,93 @@ def format_exception(e: Exception) -> str:
     return f"{exc_type}: {e}\nTraceback:\n{exc_tb}"
 
 
-def extract_rate_from_booking(page, hotel_name: str, num_nights: int = 1) -> dict:
+def _pick_rate(prices: list[int], lo: int, hi: int) -> int | None:
+    """
+    Pick the standard rate from the prices on a hotel card.
+
+    Only prices within [lo, hi] are candidates. Special deals usually appear
+    once while the standard rate appears multiple times, so the lowest
+    repeated price wins; if nothing repeats, the median avoids outliers.
+
+    Returns:
+        The selected price, or None if no price is in range
+    """
+    in_range = sorted(p for p in prices if lo <= p <= hi)
+    if not in_range:
+        return None
+
+    # Sorted, so the first value equal to its neighbour is the lowest repeat
+    for price, next_price in zip(in_range, in_range[1:]):
+        if price == next_price:
+            return price
+
+    return in_range[len(in_range) // 2]
+
+
+def rate_from_card_texts(card_texts: list[str], hotel_name: str, num_nights: int = 1) -> dict:
+    """
+    Find a hotel's card among property card texts and read its rate.
+
+    Args:
+        card_texts: Text of each property card, in page order
+        hotel_name: Name of hotel to find
+        num_nights: Number of nights in the booking (for proper price extraction)
+
+    Returns:
+        Dict with rate (total for stay), currency, availability_status; the
+        status stays "unknown" if no card matches or the card has no price
+    """
+    result = {
+        "rate": None,
+        "currency": "CAD",
+        "availability_status": "unknown",
+        "error": None
+    }
+
+    # Search for matching hotel card by key words from its name
+    key_words = hotel_key_words(hotel_name)
+
+    for card_text in card_texts:
+        # Check if this card matches the hotel (first card scoring 2+ wins)
+        if card_match_score(key_words, card_text) < 2:
+            continue
+
+        card_text_lower = card_text.lower()
+
+        # Found the hotel card - check availability
+        if SOLD_OUT_RE.search(card_text_lower):
+            result["availability_status"] = "sold_out"
+            # Don't try to extract prices for sold out - alternative dates shown
+            break
+
+        # Extract all CAD prices from the card
+        all_prices = CAD_PRICE_RE.findall(card_text)
+        if all_prices:
+            prices_int = [int(p.replace(',', '')) for p in all_prices]
+
+            if num_nights == 1:
+                # For single night, look for reasonable per-night rates
+                rate = _pick_rate(prices_int, 150, 2500)
+            else:
+                # For multi-night, look for totals
+                # Multi-night totals are typically $300+ for 2 nights
+                rate = _pick_rate(prices_int, 300 * num_nights, 3000 * num_nights)
+                if rate is None:
+                    # Fallback: look for any reasonable total
+                    reasonable = [p for p in prices_int if p >= 400 * num_nights]
+                    if reasonable:
+                        rate = min(reasonable)
+
+            if rate is not None:
+                result["rate"] = rate
+                result["availability_status"] = "available"
+
+        break  # Found our hotel, stop searching
+
+    return result
+
+
+async def extract_rate_from_booking(page, hotel_name: str, num_nights: int = 1) -> dict:
     """
     Extract rate information from Booking.com search results.
 
@@ -372,111 +1219,58 @@ def extract_rate_from_booking(page, hotel_name: str, num_nights: int = 1) -> dic
 
     try:
         # Dismiss cookie popup if present
-        dismiss_cookie_popup(page)
-
-        # Find property cards
-        property_cards = page.locator('[data-testid="property-card"]').all()
-
-        # Search for matching hotel card
-        hotel_name_lower = hotel_name.lower()
-        # Get key words from hotel name for matching
-        key_words = [w.lower() for w in hotel_name.split() if len(w) > 3][:3]
+        await dismiss_cookie_popup(page)
+
+        # Harvest the first 15 property cards in one round-trip, returning only
+        # those with 2+ key words near the top. This is a loose superset of
+        # card_match_score (substrings, wider header), which still decides
+        card_texts = await page.evaluate(
+            """([selector, words, headerChars]) => [...document.querySelectorAll(selector)]
+                .slice(0, 15)
+                .map(c => c.innerText)
+                .filter(t => {
+                    const header = t.slice(0, headerChars).toLowerCase();
+                    return words.filter(w => header.includes(w)).length >= 2;
+                })""",
+            [PROPERTY_CARD_SELECTOR, sorted(hotel_key_words(hotel_name)), CARD_HEADER_CHARS * 2],
+        )
 
-        for card in property_cards[:15]:
-            try:
-                card_text = card.inner_text(timeout=2000)
-                card_text_lower = card_text.lower()
-
-                # Check if this card matches the hotel
-                matches = sum(1 for word in key_words if word in card_text_lower)
-                if matches < 2:
-                    continue
-
-                # Found the hotel card - check availability
-                is_sold_out = (
-                    'no availability' in card_text_lower or
-                    'unavailable' in card_text_lower or
-                    'this property is unavailable' in card_text_lower
-                )
-
-                if is_sold_out:
-                    result["availability_status"] = "sold_out"
-                    # Don't try to extract prices for sold out - alternative dates shown
-                    break
-
-                # Extract all CAD prices from the card
-                all_prices = re.findall(r'(?:CA\$|CAD|C\$)\s*([\d,]+)', card_text)
-                if all_prices:
-                    prices_int = [int(p.replace(',', '')) for p in all_prices]
-
-                    # Look for the most commonly appearing price (standard rate)
-                    # Special deals usually appear once, standard rate appears multiple times
-                    price_counts = Counter(prices_int)
-
-                    if num_nights == 1:
-                        # For single night, look for reasonable per-night rates
-                        single_night_prices = [p for p in prices_int if 150 <= p <= 2500]
-                        if single_night_prices:
-                            # Prefer price that appears multiple times (standard rate)
-                            repeated = [p for p in single_night_prices if price_counts[p] > 1]
-                            if repeated:
-                                result["rate"] = min(repeated)
-                            else:
-                                # If no repeats, take the median to avoid outliers
-                                sorted_prices = sorted(single_night_prices)
-                                result["rate"] = sorted_prices[len(sorted_prices) // 2]
-                            result["availability_status"] = "available"
-                    else:
-                        # For multi-night, look for totals
-                        # Multi-night totals are typically $300+ for 2 nights
-                        min_total = 300 * num_nights
-                        max_total = 3000 * num_nights
-                        total_prices = [p for p in prices_int if min_total <= p <= max_total]
-
-                        if total_prices:
-                            # Prefer price that appears multiple times (standard rate)
-                            repeated = [p for p in total_prices if price_counts[p] > 1]
-                            if repeated:
-                                result["rate"] = min(repeated)
-                            else:
-                                # Take median to avoid promotional outliers
-                                sorted_prices = sorted(total_prices)
-                                result["rate"] = sorted_prices[len(sorted_prices) // 2]
-                            result["availability_status"] = "available"
-                        elif prices_int:
-                            # Fallback: look for any reasonable total
-                            reasonable = [p for p in prices_int if p >= 400 * num_nights]
-                            if reasonable:
-                                result["rate"] = min(reasonable)
-                                result["availability_status"] = "available"
-
-                break  # Found our hotel, stop searching
-
-            except Exception:
-                continue
+        result.update(rate_from_card_texts(card_texts, hotel_name, num_nights))
 
         # If we didn't find the specific hotel, try page-wide price extraction
         if result["rate"] is None and result["availability_status"] not in ["sold_out"]:
-            page_text = page.inner_text("body")
+            # Read only the most specific results area present, falling back to
+            # the whole body, in one round-trip
+            page_text = await page.evaluate(
+                """(selectors) => {
+                    for (const selector of selectors) {
+                        const scope = document.querySelector(selector);
+                        if (scope) return scope.innerText;
+                    }
+                    return document.body ? document.body.innerText : "";
+                }""",
+                list(AVAILABILITY_SCOPE_SELECTORS),
+            )
+            page_text = page_text.lower()
 
             # Check for general sold out
-            if "no availability" in page_text.lower() or "sold out" in page_text.lower():
+            if "no availability" in page_text or "sold out" in page_text:
                 result["availability_status"] = "sold_out"
             else:
                 result["availability_status"] = "not_found"
                 result["error"] = "Hotel not found in results"
 
     except PlaywrightTimeout as e:
-        diagnostics = capture_page_diagnostics(page, hotel_name, "extraction_timeout")
+        diagnostics = await capture_page_diagnostics(page, hotel_name, "extraction_timeout")
         logger.error(f"Timeout extracting rate for {hotel_name}")
-        logger.debug(f"Timeout diagnostics: {diagnostics}")
+        logger.debug("Timeout diagnostics: %s", diagnostics)
         result["error"] = "Page load timeout"
         result["availability_status"] = "error"
         result["diagnostics"] = diagnostics
     except Exception as e:
-        diagnostics = capture_page_diagnostics(page, hotel_name, "extraction_error")
+        diagnostics = await capture_page_diagnostics(page, hotel_name, "extraction_error")
         logger.error(f"Error extracting rate for {hotel_name}: {type(e).__name__}: {e}")
-        logger.debug(f"Error diagnostics: {diagnostics}")
+        logger.debug("Error diagnostics: %s", diagnostics)
         result["error"] = f"{type(e).__name__}: {e}"
         result["availability_status"] = "error"
         result["diagnostics"] = diagnostics
@@ -484,45 +1278,195 @@ def extract_rate_from_booking(page, hotel_name: str, num_nights: int = 1) -> dic
     return result
 
 
-def fetch_booking_rate(page, hotel_name: str, city_name: str, check_in: str, check_out: str, max_retries: int = 3) -> dict:
+async def _get_redis():
+    """Connect to the Redis response cache, or return None to use the in-process cache."""
+    global _redis_client, _redis_unavailable
+    if _redis_client is not None or _redis_unavailable:
+        return _redis_client
+
+    redis_url = os.environ.get(REDIS_URL_ENV)
+    if not redis_url or aioredis is None:
+        _redis_unavailable = True
+        return None
+
+    try:
+        client = aioredis.from_url(redis_url)
+        await client.ping()
+    except Exception as e:
+        logger.warning(f"Redis cache unavailable at {redis_url}, using in-process cache: {type(e).__name__}: {e}")
+        _redis_unavailable = True
+        return None
+
+    _redis_client = client
+    logger.info(f"Using Redis response cache at {redis_url}")
+    return _redis_client
+
+
+def _rate_cache_key(hotel_name: str, city_name: str, check_in: str, check_out: str) -> str:
+    """Cache key for one hotel stay."""
+    return "pitchprice:rate:" + hashlib.md5(
+        f"{hotel_name}:{city_name}:{check_in}:{check_out}".encode()
+    ).hexdigest()
+
+
+async def get_cached_rate(key: str) -> dict | None:
+    """Look up a cached definitive rate result, or None."""
+    redis_client = await _get_redis()
+    cached = None
+    if redis_client is not None:
+        try:
+            raw = await redis_client.get(key)
+            cached = _loads_line(raw) if raw else None
+        except Exception as e:
+            logger.debug(f"Redis get failed for {key}: {type(e).__name__}: {e}")
+    elif key in _local_rate_cache:
+        expires_at, value = _local_rate_cache[key]
+        if expires_at > time.monotonic():
+            _local_rate_cache.move_to_end(key)
+            cached = value
+        else:
+            del _local_rate_cache[key]
+
+    if cached is not None and cached.get("availability_status") in RATE_CACHEABLE_STATUSES:
+        return dict(cached)
+    return None
+
+
+async def store_cached_rate(key: str, result: dict, ttl: int = RATE_CACHE_TTL_SECONDS, maxsize: int = 4096):
+    """Cache a rate result if it's definitive (available/sold_out)."""
+    if result.get("availability_status") not in RATE_CACHEABLE_STATUSES:
+        return
+
+    redis_client = await _get_redis()
+    if redis_client is not None:
+        try:
+            await redis_client.set(key, _dumps_compact(result), ex=ttl)
+        except Exception as e:
+            logger.debug(f"Redis set failed for {key}: {type(e).__name__}: {e}")
+    else:
+        _local_rate_cache[key] = (time.monotonic() + ttl, dict(result))
+        _local_rate_cache.move_to_end(key)
+        if len(_local_rate_cache) > maxsize:
+            _local_rate_cache.popitem(last=False)
+
+
+def cached_rate(ttl: int = RATE_CACHE_TTL_SECONDS, maxsize: int = 4096):
+    """
+    Cache rate lookups keyed by (hotel, city, check_in, check_out).
+
+    Results are stored as JSON in Redis when PITCHPRICE_REDIS_URL is set and
+    reachable, otherwise in a bounded in-process LRU. Only definitive results
+    (available/sold_out) are cached so errors are always retried. Concurrent
+    calls for the same key wait on the first one instead of fetching again.
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(page, hotel_name: str, city_name: str, check_in: str, check_out: str, *args, **kwargs):
+            key = _rate_cache_key(hotel_name, city_name, check_in, check_out)
+            cached = await get_cached_rate(key)
+            if cached is not None:
+                logger.debug("Cache hit: %s %s -> %s", hotel_name, check_in, check_out)
+                return cached
+
+            # Adjacent dates overlap (one task's 2-night stay is another's
+            # neighbour lookup), so wait on a fetch already in progress
+            inflight = _inflight_rates.get(key)
+            if inflight is not None:
+                shared = await asyncio.shield(inflight)
+                if shared is not None and shared.get("availability_status") in RATE_CACHEABLE_STATUSES:
+                    logger.debug("Shared in-flight lookup: %s %s -> %s", hotel_name, check_in, check_out)
+                    return shared
+
+            future = asyncio.get_running_loop().create_future()
+            _inflight_rates[key] = future
+            result = None
+            try:
+                result = await func(page, hotel_name, city_name, check_in, check_out, *args, **kwargs)
+                await store_cached_rate(key, result, ttl=ttl, maxsize=maxsize)
+                return result
+            finally:
+                # Waiters fall back to their own fetch if this one failed
+                if _inflight_rates.get(key) is future:
+                    del _inflight_rates[key]
+                future.set_result(result)
+
+        return wrapper
+
+    return decorator
+
+
+@cached_rate()
+async def fetch_booking_rate(page, hotel_name: str, city_name: str, check_in: str, check_out: str, max_retries: int = 3, api_client: httpx.AsyncClient = None) -> dict:
     """
     Fetch rate from Booking.com for a specific date range with retry support.
 
+    With an api_client, tries the GraphQL API (if a query is captured), then
+    the server-rendered results page, and falls back to the browser if neither
+    answers.
+
     Returns:
         Dict with rate (TOTAL for the stay) and availability_status
     """
+    global _graphql_api, _html_fast_path
+    if api_client is not None and _graphql_api:
+        try:
+            return await fetch_booking_rate_api(api_client, hotel_name, city_name, check_in, check_out)
+        except BookingBotCheckError as e:
+            # Same as the HTML tier: don't repeat the warm-up for every task
+            _graphql_api = False
+            logger.warning("API bot check for %s (%s), using the browser for the rest of the run", hotel_name, e)
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("API request failed for %s, falling back to browser: %s: %s", hotel_name, type(e).__name__, e)
+
+    if api_client is not None and _html_fast_path:
+        try:
+            return await fetch_booking_rate_html(api_client, hotel_name, city_name, check_in, check_out)
+        except BookingBotCheckError as e:
+            # Challenges apply to the whole session, so stop paying for the request
+            _html_fast_path = False
+            logger.warning("Search results HTML blocked (%s), using the browser for the rest of the run", e)
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug("HTML fetch failed for %s, falling back to browser: %s: %s", hotel_name, type(e).__name__, e)
+
+    if page is None:
+        raise BrowserRequiredError(f"API could not answer {check_in} -> {check_out}")
+
     url = build_booking_url(hotel_name, city_name, check_in, check_out)
+    host = urlsplit(url).hostname
 
     # Calculate number of nights
-    check_in_dt = datetime.strptime(check_in, "%Y-%m-%d")
-    check_out_dt = datetime.strptime(check_out, "%Y-%m-%d")
+    check_in_dt = _parse_ymd(check_in)
+    check_out_dt = _parse_ymd(check_out)
     num_nights = (check_out_dt - check_in_dt).days
 
     last_error = None
 
     for attempt in range(1, max_retries + 1):
         try:
-            logger.debug(f"Attempt {attempt}/{max_retries}: {hotel_name} {check_in}")
+            logger.debug("Attempt %d/%d: %s %s", attempt, max_retries, hotel_name, check_in)
 
-            response = page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            await host_limiter.wait(host)
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
+            if response:
+                host_limiter.record(host, response.status, response.headers)
 
             # Capture HTTP status for diagnostics
             http_status = response.status if response else None
-            logger.debug(f"HTTP status: {http_status} for {hotel_name}")
+            logger.debug("HTTP status: %s for %s", http_status, hotel_name)
 
             if http_status and http_status >= 400:
-                logger.warning(f"HTTP {http_status} for {hotel_name} on attempt {attempt}")
+                logger.warning("HTTP %s for %s on attempt %d", http_status, hotel_name, attempt)
 
-            time.sleep(4)
-            page.wait_for_load_state("networkidle", timeout=30000)
-            time.sleep(1)
+            # Wait for results (or the empty state) rather than networkidle,
+            # which Booking.com's analytics beacons rarely let settle
+            await page.wait_for_selector(RESULTS_READY_SELECTOR, timeout=RESULTS_TIMEOUT_MS)
 
-            result = extract_rate_from_booking(page, hotel_name, num_nights)
+            result = await extract_rate_from_booking(page, hotel_name, num_nights)
 
             # If successful extraction, return
             if result.get("rate") is not None or result.get("availability_status") in ["sold_out", "not_found"]:
                 if attempt > 1:
-                    logger.info(f"Succeeded on attempt {attempt} for {hotel_name}")
+                    logger.info("Succeeded on attempt %d for %s", attempt, hotel_name)
                 return result
 
             # If error but not a hard failure, might want to retry
@@ -533,27 +1477,27 @@ def fetch_booking_rate(page, hotel_name: str, city_name: str, check_in: str, che
 
         except PlaywrightTimeout as e:
             last_error = e
-            logger.warning(f"Timeout on attempt {attempt}/{max_retries} for {hotel_name}: {e}")
+            logger.warning("Timeout on attempt %d/%d for %s: %s", attempt, max_retries, hotel_name, e)
             if attempt < max_retries:
-                backoff = 2 * attempt
-                logger.debug(f"Backing off {backoff}s before retry")
-                time.sleep(backoff)
+                backoff = backoff_delay(attempt, 1.0)
+                logger.debug("Backing off %.1fs before retry", backoff)
+                await asyncio.sleep(backoff)
         except Exception as e:
             last_error = e
-            logger.warning(f"Error on attempt {attempt}/{max_retries} for {hotel_name}: {type(e).__name__}: {e}")
+            logger.warning("Error on attempt %d/%d for %s: %s: %s", attempt, max_retries, hotel_name, type(e).__name__, e)
 
             # Check if this is a browser corruption error - don't retry, need context refresh
             if is_browser_corruption_error(e):
-                logger.error(f"Browser corruption detected for {hotel_name}, need context refresh")
+                logger.error("Browser corruption detected for %s, need context refresh", hotel_name)
                 raise BrowserCorruptionError(f"Browser corrupted: {type(e).__name__}: {e}") from e
 
             if attempt < max_retries:
-                backoff = 2 * attempt
-                logger.debug(f"Backing off {backoff}s before retry")
-                time.sleep(backoff)
+                backoff = backoff_delay(attempt, 1.0)
+                logger.debug("Backing off %.1fs before retry", backoff)
+                await asyncio.sleep(backoff)
 
     # All retries exhausted
-    logger.error(f"Failed after {max_retries} attempts for {hotel_name}: {type(last_error).__name__}: {last_error}")
+    logger.error("Failed after %d attempts for %s: %s: %s", max_retries, hotel_name, type(last_error).__name__, last_error)
     return {
         "rate": None,
         "availability_status": "error",
@@ -561,7 +1505,26 @@ def fetch_booking_rate(page, hotel_name: str, city_name: str, check_in: str, che
     }
 
 
-def calculate_rate_from_multi_night(page, hotel: dict, city_name: str, target_date: str) -> dict:
+async def fetch_booking_rate_in_new_tab(page, hotel_name: str, city_name: str, check_in: str, check_out: str, **kwargs) -> dict:
+    """Run fetch_booking_rate on a fresh tab in page's context so it can run alongside page."""
+    if page is None:
+        return await fetch_booking_rate(None, hotel_name, city_name, check_in, check_out, **kwargs)
+    try:
+        tab = await page.context.new_page()
+    except Exception as e:
+        if is_browser_corruption_error(e):
+            raise BrowserCorruptionError(f"Browser corrupted: {type(e).__name__}: {e}") from e
+        raise
+    try:
+        return await fetch_booking_rate(tab, hotel_name, city_name, check_in, check_out, **kwargs)
+    finally:
+        try:
+            await tab.close()
+        except Exception as e:
+            logger.debug(f"Ignoring error closing tab: {type(e).__name__}: {e}")
+
+
+async def calculate_rate_from_multi_night(page, hotel: dict, city_name: str, target_date: str, api_client: httpx.AsyncClient = None) -> dict:
     """
     Calculate single-night rate when there's a 2-night minimum.
 
@@ -576,10 +1539,10 @@ def calculate_rate_from_multi_night(page, hotel: dict, city_name: str, target_da
     Returns:
         Dict with calculated rate and verification info
     """
-    target_dt = datetime.strptime(target_date, "%Y-%m-%d")
-    prev_day = (target_dt - timedelta(days=1)).strftime("%Y-%m-%d")
-    next_day = (target_dt + timedelta(days=1)).strftime("%Y-%m-%d")
-    day_after_next = (target_dt + timedelta(days=2)).strftime("%Y-%m-%d")
+    target_dt = _parse_ymd(target_date)
+    prev_day = (target_dt - timedelta(days=1)).isoformat()
+    next_day = (target_dt + timedelta(days=1)).isoformat()
+    day_after_next = (target_dt + timedelta(days=2)).isoformat()
 
     result = {
         "rate": None,
@@ -592,23 +1555,25 @@ def calculate_rate_from_multi_night(page, hotel: dict, city_name: str, target_da
 
     hotel_name = hotel["name"]
 
+    # The four stays are independent, so fetch them concurrently on separate tabs:
+    # - prev_day to next_day (2 nights) and prev_day (1 night) for method 1
+    # - target_date to day_after_next (2 nights) and next_day (1 night) for method 2
+    logger.debug("Fetching 2-night and 1-night rates around %s for %s", target_date, hotel_name)
+    two_night_1, one_night_prev, two_night_2, one_night_next = await asyncio.gather(
+        fetch_booking_rate(page, hotel_name, city_name, prev_day, next_day, api_client=api_client),
+        fetch_booking_rate_in_new_tab(page, hotel_name, city_name, prev_day, target_date, api_client=api_client),
+        fetch_booking_rate_in_new_tab(page, hotel_name, city_name, target_date, day_after_next, api_client=api_client),
+        fetch_booking_rate_in_new_tab(page, hotel_name, city_name, next_day, day_after_next, api_client=api_client),
+    )
+
     # Method 1: (Prev + Target) 2-night total minus Prev 1-night
     # e.g., (Fri+Sat) - Fri = Sat
-    logger.debug(f"Trying 2-night calculation (prev+target) for {hotel_name}")
-
-    # Get 2-night rate: prev_day to next_day (2 nights)
-    two_night_1 = fetch_booking_rate(page, hotel_name, city_name, prev_day, next_day)
-    time.sleep(2)
-
-    # Get 1-night rate for prev_day (if available)
-    one_night_prev = fetch_booking_rate(page, hotel_name, city_name, prev_day, target_date)
-    time.sleep(2)
-
     calculated_rate_1 = None
     if two_night_1.get("rate") and one_night_prev.get("rate"):
         # Target rate = 2-night total - prev night rate
         calculated_rate_1 = two_night_1["rate"] - one_night_prev["rate"]
-        logger.debug(f"2-night (prev+target): ${two_night_1['rate']}, 1-night prev: ${one_night_prev['rate']}, Calculated: ${calculated_rate_1}")
+        logger.debug("2-night (prev+target): $%s, 1-night prev: $%s, Calculated: $%s",
+                     two_night_1['rate'], one_night_prev['rate'], calculated_rate_1)
         result["rate_calculation"] = {
             "method": "prev+target minus prev",
             "two_night_total": two_night_1["rate"],
@@ -618,21 +1583,12 @@ def calculate_rate_from_multi_night(page, hotel: dict, city_name: str, target_da
 
     # Method 2: (Target + Next) 2-night total minus Next 1-night
     # e.g., (Sat+Sun) - Sun = Sat
-    logger.debug(f"Verifying with 2-night calculation (target+next) for {hotel_name}")
-
-    # Get 2-night rate: target_date to day_after_next (2 nights)
-    two_night_2 = fetch_booking_rate(page, hotel_name, city_name, target_date, day_after_next)
-    time.sleep(2)
-
-    # Get 1-night rate for next_day
-    one_night_next = fetch_booking_rate(page, hotel_name, city_name, next_day, day_after_next)
-    time.sleep(2)
-
     calculated_rate_2 = None
     if two_night_2.get("rate") and one_night_next.get("rate"):
         # Target rate = 2-night total - next night rate
         calculated_rate_2 = two_night_2["rate"] - one_night_next["rate"]
-        logger.debug(f"2-night (target+next): ${two_night_2['rate']}, 1-night next: ${one_night_next['rate']}, Calculated: ${calculated_rate_2}")
+        logger.debug("2-night (target+next): $%s, 1-night next: $%s, Calculated: $%s",
+                     two_night_2['rate'], one_night_next['rate'], calculated_rate_2)
         result["verification"] = {
             "method": "target+next minus next",
             "two_night_total": two_night_2["rate"],
@@ -648,7 +1604,7 @@ def calculate_rate_from_multi_night(page, hotel: dict, city_name: str, target_da
         if diff <= 50:  # Within $50 tolerance
             result["rate"] = int(round(avg))
             result["availability_status"] = "available_calculated"
-            logger.debug(f"VERIFIED: Both methods agree (~${result['rate']}) for {hotel_name}")
+            logger.debug("VERIFIED: Both methods agree (~$%s) for %s", result['rate'], hotel_name)
         else:
             # Use the average but note discrepancy
             result["rate"] = int(round(avg))
@@ -658,11 +1614,11 @@ def calculate_rate_from_multi_night(page, hotel: dict, city_name: str, target_da
     elif calculated_rate_1:
         result["rate"] = calculated_rate_1
         result["availability_status"] = "available_calculated"
-        logger.debug(f"Using first method: ${calculated_rate_1} for {hotel_name}")
+        logger.debug("Using first method: $%s for %s", calculated_rate_1, hotel_name)
     elif calculated_rate_2:
         result["rate"] = calculated_rate_2
         result["availability_status"] = "available_calculated"
-        logger.debug(f"Using second method: ${calculated_rate_2} for {hotel_name}")
+        logger.debug("Using second method: $%s for %s", calculated_rate_2, hotel_name)
     else:
         result["error"] = "Could not calculate rate from multi-night bookings"
         result["availability_status"] = "not_found"
@@ -671,7 +1627,41 @@ def calculate_rate_from_multi_night(page, hotel: dict, city_name: str, target_da
     return result
 
 
-def scrape_hotel_rate(page, hotel: dict, city_name: str, city_config: dict, event_info: dict, check_in: str) -> dict:
+def result_template(hotel: dict, city_name: str, city_config: dict, event_info: dict) -> dict:
+    """
+    Build the result fields that are the same for every date of a hotel.
+
+    Per-date fields are present (in output order) with placeholder values, so
+    callers can fill them with {**template, ...} without reordering keys.
+    """
+    # Get venue proximity (new name) or proximity (legacy)
+    venue_proximity = hotel.get("venue_proximity", hotel.get("proximity"))
+
+    return {
+        "hotel_id": hotel["id"],
+        "hotel_name": hotel["name"],
+        "city": city_name,
+        "segment": hotel["segment"],
+        "venue_proximity": venue_proximity,
+        "proximity": venue_proximity,  # Keep for backwards compatibility
+        "check_in_date": None,
+        "check_out_date": None,
+        "rate": None,
+        "currency": "CAD",
+        "availability_status": "unknown",
+        "scrape_timestamp": None,
+        "error": None,
+        # New fields for lead-time analysis
+        "event_id": event_info.get("event_id"),
+        "event_type": event_info.get("event_type"),
+        "city_type": city_config.get("city_type", "event_host"),
+        "control_for": city_config.get("control_for"),
+        "days_to_event": None,
+        "nearest_event_date": None
+    }
+
+
+async def scrape_hotel_rate(page, hotel: dict, city_name: str, city_config: dict, event_info: dict, check_in: str, api_client: httpx.AsyncClient = None, template: dict = None) -> dict:
     """
     Scrape the rate for a single hotel on a single date from Booking.com.
 
@@ -679,17 +1669,21 @@ def scrape_hotel_rate(page, hotel: dict, city_name: str, city_config: dict, even
     calculates the rate from 2-night bookings.
 
     Args:
-        page: Playwright page object
+        page: Playwright page object, or None to use only the API (raises
+              BrowserRequiredError if the API can't answer)
         hotel: Hotel configuration dict
         city_name: City name
         city_config: City configuration dict (for event dates, city_type, etc.)
         event_info: Event metadata dict
         check_in: Check-in date (YYYY-MM-DD)
+        api_client: Optional HTTP client for the Booking.com GraphQL API
+        template: Optional precomputed result_template for this hotel, so
+                  the per-hotel fields aren't rebuilt for every date
 
     Returns:
         Dict with scrape results
     """
-    check_out = (datetime.strptime(check_in, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+    check_out = day_after(check_in)
 
     # Get event dates for this city (empty for control cities)
     event_dates = city_config.get("event_dates", city_config.get("game_dates", []))
@@ -697,42 +1691,28 @@ def scrape_hotel_rate(page, hotel: dict, city_name: str, city_config: dict, even
     # Calculate days to event
     lead_time = calculate_days_to_event(check_in, event_dates)
 
-    # Get venue proximity (new name) or proximity (legacy)
-    venue_proximity = hotel.get("venue_proximity", hotel.get("proximity"))
+    if template is None:
+        template = result_template(hotel, city_name, city_config, event_info)
 
     result = {
-        "hotel_id": hotel["id"],
-        "hotel_name": hotel["name"],
-        "city": city_name,
-        "segment": hotel["segment"],
-        "venue_proximity": venue_proximity,
-        "proximity": venue_proximity,  # Keep for backwards compatibility
+        **template,
         "check_in_date": check_in,
         "check_out_date": check_out,
-        "rate": None,
-        "currency": "CAD",
-        "availability_status": "unknown",
-        "scrape_timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        "error": None,
-        # New fields for lead-time analysis
-        "event_id": event_info.get("event_id"),
-        "event_type": event_info.get("event_type"),
-        "city_type": city_config.get("city_type", "event_host"),
-        "control_for": city_config.get("control_for"),
+        "scrape_timestamp": utc_now_iso(),
         "days_to_event": lead_time["days_to_event"],
         "nearest_event_date": lead_time["nearest_event_date"]
     }
 
     try:
         # First, try single-night booking
-        rate_info = fetch_booking_rate(page, hotel["name"], city_name, check_in, check_out)
+        rate_info = await fetch_booking_rate(page, hotel["name"], city_name, check_in, check_out, api_client=api_client)
 
         if rate_info.get("availability_status") == "sold_out" or (
             rate_info.get("availability_status") == "available" and rate_info.get("rate") is None
         ):
             # Likely 2-night minimum - try multi-night calculation
-            logger.debug(f"Single night unavailable for {hotel['name']}, trying 2-night calculation")
-            rate_info = calculate_rate_from_multi_night(page, hotel, city_name, check_in)
+            logger.debug("Single night unavailable for %s, trying 2-night calculation", hotel['name'])
+            rate_info = await calculate_rate_from_multi_night(page, hotel, city_name, check_in, api_client=api_client)
 
         result.update(rate_info)
 
@@ -748,6 +1728,9 @@ def scrape_hotel_rate(page, hotel: dict, city_name: str, city_config: dict, even
                 result["error"] = sanity["reason"]
                 result["availability_status"] = "error"
 
+    except (BrowserCorruptionError, BrowserRequiredError):
+        # Let the caller recover the browser (or get one) and retry
+        raise
     except PlaywrightTimeout:
         result["error"] = "Navigation timeout"
         result["availability_status"] = "error"
@@ -758,47 +1741,67 @@ def scrape_hotel_rate(page, hotel: dict, city_name: str, city_config: dict, even
     return result
 
 
-def generate_scrape_report(all_results: list, errors: list) -> dict:
-    """Generate a summary report of the scrape session."""
-    report = {
-        "total_requests": len(all_results),
-        "successful": len([r for r in all_results if r.get("rate") is not None]),
-        "errors": len(errors),
-        "error_rate": f"{(len(errors) / len(all_results) * 100):.1f}%" if all_results else "N/A",
-        "error_breakdown": {},
-        "hotels_with_issues": [],
-    }
+# Error report categories, checked in priority order
+ERROR_CATEGORY_PATTERNS = [
+    (re.compile("heap growth", re.I), "Memory/Heap"),
+    (re.compile("timeout", re.I), "Timeout"),
+    (re.compile("could not calculate", re.I), "Multi-night calculation"),
+    (re.compile("not found", re.I), "Hotel not found"),
+    (re.compile("failed after", re.I), "Retry exhausted"),
+]
 
-    # Categorize errors
-    for err in errors:
-        error_msg = err.get("error", "Unknown")
-        # Extract error category
-        if "heap growth" in error_msg.lower():
-            category = "Memory/Heap"
-        elif "timeout" in error_msg.lower():
-            category = "Timeout"
-        elif "could not calculate" in error_msg.lower():
-            category = "Multi-night calculation"
-        elif "not found" in error_msg.lower():
-            category = "Hotel not found"
-        elif "failed after" in error_msg.lower():
-            category = "Retry exhausted"
-        else:
-            category = "Other"
 
-        report["error_breakdown"][category] = report["error_breakdown"].get(category, 0) + 1
+def categorize_error(error_msg: str) -> str:
+    """Map an error message to its report category."""
+    for pattern, category in ERROR_CATEGORY_PATTERNS:
+        if pattern.search(error_msg):
+            return category
+    return "Other"
 
-    # Find hotels with high error rates
-    hotel_errors = {}
+
+def collect_errors(results, errors: list):
+    """Pass results through, appending an error summary to errors for each failed one."""
+    for r in results:
+        if r["error"]:
+            errors.append({"hotel": r["hotel_name"], "date": r["check_in_date"], "error": r["error"]})
+        yield r
+
+
+def generate_scrape_report(all_results, errors: list) -> dict:
+    """
+    Generate a summary report of the scrape session.
+
+    all_results may be any iterable (e.g. a stream read from disk); it is
+    consumed once, before errors is read, so errors can be filled while
+    iterating it (see collect_errors).
+    """
+    # Tally successes and per-hotel error counts in a single pass
+    total = 0
+    successful = 0
+    hotel_errors = defaultdict(lambda: {"total": 0, "errors": 0, "name": None})
     for r in all_results:
+        total += 1
+        if r.get("rate") is not None:
+            successful += 1
         hotel_id = r.get("hotel_id")
         if hotel_id:
-            if hotel_id not in hotel_errors:
-                hotel_errors[hotel_id] = {"total": 0, "errors": 0, "name": r.get("hotel_name")}
-            hotel_errors[hotel_id]["total"] += 1
+            stats = hotel_errors[hotel_id]
+            if stats["name"] is None:
+                stats["name"] = r.get("hotel_name")
+            stats["total"] += 1
             if r.get("error"):
-                hotel_errors[hotel_id]["errors"] += 1
+                stats["errors"] += 1
+
+    report = {
+        "total_requests": total,
+        "successful": successful,
+        "errors": len(errors),
+        "error_rate": f"{(len(errors) / total * 100):.1f}%" if total else "N/A",
+        "error_breakdown": dict(Counter(categorize_error(err.get("error") or "Unknown") for err in errors)),
+        "hotels_with_issues": [],
+    }
 
+    # Find hotels with high error rates
     for hotel_id, stats in hotel_errors.items():
         if stats["errors"] > 0:
             error_rate = stats["errors"] / stats["total"]
@@ -814,15 +1817,415 @@ def generate_scrape_report(all_results: list, errors: list) -> dict:
     return report
 
 
-def run_scraper(cities: list[str] = None, event_id: str = "fifa_2026", dry_run: bool = False):
+async def block_nonessential_requests(route):
+    """Abort requests the rate extractor doesn't need (images, fonts, media, analytics)."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@asynccontextmanager
+async def with_page(browser, storage_state: dict = None):
+    """
+    Open a stealth page in its own throwaway context.
+
+    Playwright keeps every Request/Response a context has seen until the
+    context is closed, so closing it after each use keeps memory flat no
+    matter how long the sweep runs. Session cookies are carried over by
+    seeding the context with storage_state instead.
+    """
+    context = None
+    try:
+        context = await browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent=BROWSER_USER_AGENT,
+            locale='en-CA',
+            timezone_id='America/Toronto',
+            storage_state=storage_state,
+        )
+        # Bounds every other page action (clicks, evaluate, tabs opened later)
+        context.set_default_timeout(RESULTS_TIMEOUT_MS)
+        await context.add_cookies(consent_cookies())
+        await context.add_init_script(STEALTH_INIT_SCRIPT)
+        await context.route("**/*", block_nonessential_requests)
+        page = await context.new_page()
+    except Exception as e:
+        if context is not None:
+            try:
+                await context.close()
+            except Exception as close_error:
+                logger.debug(f"Ignoring error closing context: {type(close_error).__name__}: {close_error}")
+        if is_browser_corruption_error(e):
+            raise BrowserCorruptionError(f"Browser corrupted: {type(e).__name__}: {e}") from e
+        raise
+
+    try:
+        yield page
+    finally:
+        try:
+            await context.close()
+        except Exception as e:
+            logger.debug(f"Ignoring error closing context: {type(e).__name__}: {e}")
+
+
+class SharedBrowser:
+    """
+    One Chromium process handing out a fresh context per task.
+
+    At most size contexts are open at once. A corrupted context is simply
+    dropped (the next task gets a new one); the browser itself is only
+    relaunched when it disconnects or corruption repeats max_corruption_streak
+    times without a clean task in between. A replaced browser is closed once
+    the contexts still running on it finish.
+
+    Cookies from the first clean task are reused by every later context and
+    saved to BROWSER_STATE_PATH on close, so the next run starts warm too.
+    """
+
+    def __init__(self, playwright, size: int, max_corruption_streak: int = 2):
+        self.playwright = playwright
+        self.size = size
+        self.max_corruption_streak = max_corruption_streak
+        self.browser = None
+        self._slots = asyncio.Semaphore(size)
+        self._browser_lock = asyncio.Lock()
+        self._corruption_streak = 0
+        self._open_contexts = Counter()
+        self._retired = set()
+        self.storage_state = None
+        self._state_captured = False
+
+    async def start(self):
+        """Load the saved session, if any, and launch the browser."""
+        if BROWSER_STATE_PATH.exists():
+            try:
+                self.storage_state = read_json(BROWSER_STATE_PATH)
+            except ValueError as e:
+                logger.warning(f"Ignoring unreadable {BROWSER_STATE_PATH}: {e}")
+        self.browser = await self._launch_browser()
+        logger.debug(f"Shared browser started ({self.size} concurrent contexts)")
+
+    async def _launch_browser(self):
+        """Launch a fresh browser instance."""
+        return await self.playwright.chromium.launch(
+            headless=True,
+            # Playwright kills the process if it isn't up in time
+            timeout=BROWSER_LAUNCH_TIMEOUT_SECONDS * 1000,
+            args=[
+                '--disable-blink-features=AutomationControlled',
+                '--disable-dev-shm-usage',
+                '--no-sandbox',
+                '--disable-gpu',
+                '--disable-extensions',
+                # Don't even decode images that slip past the route filter
+                '--blink-settings=imagesEnabled=false',
+                '--js-flags=--max-old-space-size=512',  # Limit JS heap
+            ]
+        )
+
+    async def _close_browser(self, browser):
+        """Close a browser, ignoring errors from one that already died."""
+        self._retired.discard(browser)
+        self._open_contexts.pop(browser, None)
+        try:
+            await asyncio.wait_for(browser.close(), timeout=BROWSER_CLOSE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            # A wedged Chromium is killed when the Playwright driver shuts down
+            logger.warning(f"Browser did not close within {BROWSER_CLOSE_TIMEOUT_SECONDS}s, abandoning it")
+        except Exception as e:
+            logger.debug(f"Ignoring error closing browser: {type(e).__name__}: {e}")
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a context slot and yield a page in a context of its own."""
+        async with self._slots:
+            browser = self.browser
+            self._open_contexts[browser] += 1
+            try:
+                async with with_page(browser, self.storage_state) as page:
+                    yield page
+                    if not self._state_captured:
+                        await self._capture_state(page.context)
+                self._corruption_streak = 0
+            finally:
+                self._open_contexts[browser] -= 1
+                if browser in self._retired and self._open_contexts[browser] == 0:
+                    await self._close_browser(browser)
+
+    async def recover(self):
+        """Record a corruption and relaunch the browser if it died or keeps corrupting."""
+        async with self._browser_lock:
+            self._corruption_streak += 1
+            if self.browser.is_connected() and self._corruption_streak < self.max_corruption_streak:
+                return
+
+            if self.browser.is_connected():
+                logger.info(f"Browser corrupted {self._corruption_streak} times in a row, launching new browser")
+            else:
+                logger.info("Browser not connected, launching new browser")
+            old = self.browser
+            self.browser = await self._launch_browser()
+            self._corruption_streak = 0
+            if self._open_contexts[old] == 0:
+                await self._close_browser(old)
+            else:
+                self._retired.add(old)
+
+    async def _capture_state(self, context):
+        """Adopt a context's cookies and localStorage for later contexts; retried by the next clean task on failure."""
+        try:
+            self.storage_state = await context.storage_state()
+            self._state_captured = True
+        except Exception as e:
+            logger.debug(f"Could not capture browser state: {type(e).__name__}: {e}")
+
+    async def close(self):
+        """Save the session, then close the browser and any replaced ones still draining."""
+        if self._state_captured and self.storage_state is not None:
+            try:
+                write_json(BROWSER_STATE_PATH, self.storage_state, indent=False)
+            except OSError as e:
+                logger.warning(f"Could not save browser state: {e}")
+        for browser in list(self._retired):
+            await self._close_browser(browser)
+        await self._close_browser(self.browser)
+        logger.debug("Browser closed")
+
+
+@asynccontextmanager
+async def shared_browser(playwright, size: int):
+    """Launch one SharedBrowser for the whole session and close it afterwards."""
+    browser = SharedBrowser(playwright, size=size)
+    await browser.start()
+    try:
+        yield browser
+    finally:
+        await browser.close()
+
+
+def index_results_stream(results_file: Path) -> dict:
+    """
+    Index a results stream by task without keeping the results in memory.
+
+    A resumed run can append a new result for a pair that errored earlier,
+    so the last line for each pair wins.
+
+    Returns:
+        Dict mapping (hotel_id, check_in_date) to (byte offset, result is an error)
+    """
+    offsets = {}
+    if not results_file.exists():
+        return offsets
+    with open(results_file, "rb") as f:
+        offset = 0
+        for line in f:
+            try:
+                result = _loads_line(line)
+            except ValueError:
+                # A crash can leave the last line half-written
+                result = None
+            if result is not None:
+                key = (result["hotel_id"], result["check_in_date"])
+                offsets[key] = (offset, result["availability_status"] == "error")
+            offset += len(line)
+    return offsets
+
+
+def iter_results_stream(results_file: Path, tasks: list[tuple], offsets: dict):
+    """Yield the recorded result for each task, in task order, one at a time."""
+    with open(results_file, "rb") as f:
+        for hotel, _, check_in in tasks:
+            entry = offsets.get((hotel["id"], check_in))
+            if entry is None:
+                logger.warning(f"No result recorded for {hotel['name']} {check_in}")
+                continue
+            f.seek(entry[0])
+            yield _loads_line(f.readline())
+
+
+async def scrape_session(
+    tasks: list[tuple],
+    event_info: dict,
+    settings: dict,
+    concurrency: int,
+    pool_size: int,
+    results_file: Path,
+    api_client=None,
+):
+    """
+    Scrape a flat list of hotel/date tasks through one shared browser.
+
+    Results aren't kept in memory: each one is appended to results_file as an
+    NDJSON line the moment it finishes. That file doubles as the resume
+    checkpoint; pairs already in it without an error are skipped.
+
+    Args:
+        tasks: (hotel, city_config, check_in) tuples, across all cities
+        event_info: Event metadata for tagging results
+        settings: scrape_settings from the config
+        concurrency: Maximum number of tasks in flight
+        pool_size: Maximum number of browser contexts open at once
+        results_file: NDJSON stream the results are appended to
+        api_client: Optional GraphQL client tried before the browser
+    """
+    if concurrency < 1 or pool_size < 1:
+        raise ValueError(f"concurrency and pool_size must be at least 1 (got {concurrency}, {pool_size})")
+
+    # Politeness is enforced per host on every request, not per task
+    host_limiter.min_gap = settings.get("host_delay_min_seconds", 5)
+    host_limiter.max_gap = settings.get("host_delay_max_seconds", 10)
+    done = {key for key, (_, is_error) in index_results_stream(results_file).items() if not is_error}
+    # Hotels whose dates can be fetched in ranges from the availability calendar
+    # (opt out per hotel with "supports_range": false)
+    calendar_enabled = api_client is not None and load_booking_calendar_query() is not None
+    hotel_dates = defaultdict(list)
+    for hotel, _, check_in in tasks:
+        hotel_dates[hotel["id"]].append(check_in)
+    calendar_prefetches = {}
+
+    # Per-hotel result fields, for building error results without the lookups
+    templates = {
+        hotel["id"]: result_template(hotel, city_config["name"], city_config, event_info)
+        for hotel, city_config, _ in tasks
+    }
+    if done:
+        logger.info(f"Resuming from {results_file}: {len(done)} of {len(tasks)} hotel/date pairs already scraped")
+
+    async with async_playwright() as p, shared_browser(p, pool_size) as browser:
+
+        async def scrape_task(hotel: dict, city_config: dict, check_in: str) -> dict:
+            """Scrape one hotel/date pair, in a fresh context if the API can't answer it."""
+            city_name = city_config["name"]
+
+            # The first task for a hotel fetches its whole date range; the rest wait
+            # for it and then find their single-night result in the cache
+            if calendar_enabled and hotel.get("supports_range", True):
+                if hotel["id"] not in calendar_prefetches:
+                    calendar_prefetches[hotel["id"]] = asyncio.ensure_future(
+                        prefetch_booking_calendar(api_client, hotel["name"], city_name, hotel_dates[hotel["id"]])
+                    )
+                await calendar_prefetches[hotel["id"]]
+
+            # Try the API without holding a browser context; the cache keeps any
+            # legs it did answer, so the browser pass only redoes the rest
+            result = None
+            if api_client is not None:
+                try:
+                    result = await scrape_hotel_rate(
+                        None, hotel, city_name, city_config, event_info, check_in,
+                        api_client=api_client, template=templates[hotel["id"]]
+                    )
+                except BrowserRequiredError as e:
+                    logger.debug("%s %s: %s, using browser", hotel['name'], check_in, e)
+
+            if result is None:
+                # Retry loop for browser corruption recovery
+                max_corruption_retries = 2
+                for corruption_retry in range(max_corruption_retries + 1):
+                    try:
+                        # Queue for the host before taking a context; the first
+                        # navigation spends this slot
+                        async with host_limiter.reserved(BOOKING_HOST), browser.page() as page:
+                            result = await scrape_hotel_rate(
+                                page, hotel, city_name, city_config, event_info, check_in,
+                                template=templates[hotel["id"]]
+                            )
+                        break  # Success, exit retry loop
+                    except BrowserCorruptionError as e:
+                        if corruption_retry < max_corruption_retries:
+                            logger.warning(f"Browser corruption on {hotel['name']} {check_in}, retrying in a new context (attempt {corruption_retry + 1}/{max_corruption_retries})")
+                            await browser.recover()
+                            await asyncio.sleep(backoff_delay(corruption_retry, 0.5))
+                        else:
+                            # Exhausted retries, record error
+                            logger.error(f"Browser corruption persists for {hotel['name']} {check_in} after {max_corruption_retries} retries")
+                            result = {
+                                **templates[hotel["id"]],
+                                "check_in_date": check_in,
+                                "check_out_date": day_after(check_in),
+                                "availability_status": "error",
+                                "scrape_timestamp": utc_now_iso(),
+                                "error": str(e)
+                            }
+
+            if result["error"]:
+                logger.error("%s %s: ERROR - %s", hotel['name'], check_in, result['error'])
+            elif result["rate"]:
+                logger.info("%s %s: $%s %s", hotel['name'], check_in, result['rate'], result['currency'])
+            else:
+                logger.info("%s %s: %s", hotel['name'], check_in, result['availability_status'])
+
+            return result
+
+        async def worker(queue: asyncio.Queue):
+            """Pull tasks until the queue is empty, appending each result to the stream."""
+            while True:
+                try:
+                    task = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                # One unexpected failure shouldn't take the other workers down
+                # with it; record it as an error result and move on
+                try:
+                    result = await scrape_task(*task)
+                except Exception as e:
+                    hotel, _, check_in = task
+                    logger.error(f"Unexpected error scraping {hotel['name']} {check_in}: {type(e).__name__}: {e}")
+                    result = {
+                        **templates[hotel["id"]],
+                        "check_in_date": check_in,
+                        "check_out_date": day_after(check_in),
+                        "availability_status": "error",
+                        "scrape_timestamp": utc_now_iso(),
+                        "error": f"{type(e).__name__}: {e}"
+                    }
+                results_stream.write(json_line(result))
+                results_stream.flush()
+                os.fsync(results_stream.fileno())
+
+        with open(results_file, "ab") as results_stream:
+            # Terminate a line half-written by a crash so it can't swallow the next result
+            if results_stream.tell() > 0:
+                with open(results_file, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        results_stream.write(b"\n")
+
+            # A fixed pool of workers rather than one coroutine per task, so a
+            # 36k-task sweep doesn't hold 36k suspended coroutines
+            pending = asyncio.Queue()
+            for hotel, city_config, check_in in tasks:
+                if (hotel["id"], check_in) not in done:
+                    pending.put_nowait((hotel, city_config, check_in))
+            await asyncio.gather(*(worker(pending) for _ in range(min(concurrency, pending.qsize()))))
+
+
+def run_scraper(cities: list[str] = None, event_id: str = "fifa_2026", dry_run: bool = False,
+                concurrency: int = None, pool_size: int = None, resume: str = None):
+    """Run the scraper for specified cities (see run_scraper_async)."""
+    return asyncio.run(run_scraper_async(
+        cities=cities, event_id=event_id, dry_run=dry_run,
+        concurrency=concurrency, pool_size=pool_size, resume=resume,
+    ))
+
+
+async def run_scraper_async(cities: list[str] = None, event_id: str = "fifa_2026", dry_run: bool = False,
+                            concurrency: int = None, pool_size: int = None, resume: str = None):
     """
-    Run the scraper for specified cities with memory management.
+    Run the scraper for specified cities, fanning hotel/date pairs out concurrently.
 
     Args:
         cities: List of city keys to scrape (e.g., ["toronto", "vancouver", "montreal"]).
                 If None, scrapes all cities for the event.
         event_id: Event identifier (default: fifa_2026)
         dry_run: If True, only print what would be scraped without actually scraping.
+        concurrency: Maximum hotel/date pairs in flight (default: max_concurrency setting)
+        pool_size: Maximum browser contexts open at once (default: same as concurrency)
+        resume: Timestamp (YYYYMMDD_HHMMSS) of an interrupted scrape to continue from
+                its checkpoint instead of starting over
     """
     config = load_config()
     settings = config["scrape_settings"]
@@ -836,16 +2239,16 @@ def run_scraper(cities: list[str] = None, event_id: str = "fifa_2026", dry_run:
     if cities is None:
         cities = list(cities_config.keys())
 
-    # Prepare output directory
-    now = datetime.now(timezone.utc)
+    # Prepare output directory (a resumed run keeps its original timestamp)
+    if resume:
+        now = datetime.strptime(resume, SCRAPE_TIMESTAMP_FORMAT).replace(tzinfo=UTC)
+    else:
+        now = datetime.now(UTC)
     scrape_date = now.strftime("%Y-%m-%d")
-    scrape_timestamp = now.strftime("%Y%m%d_%H%M%S")
+    scrape_timestamp = now.strftime(SCRAPE_TIMESTAMP_FORMAT)
     output_dir = DATA_DIR / scrape_date
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    all_results = []
-    errors = []
-
     logger.info("=" * 60)
     logger.info("PitchPrice Hotel Rate Scraper")
     logger.info("=" * 60)
@@ -857,202 +2260,84 @@ def run_scraper(cities: list[str] = None, event_id: str = "fifa_2026", dry_run:
         logger.info("DRY RUN - Not actually scraping")
         for city_key in cities:
             city_config = cities_config[city_key]
-            # Support both new (scrape_date_range) and legacy (date_range) schema
-            date_range = city_config.get("scrape_date_range", city_config.get("date_range", {}))
-            dates = generate_dates(date_range["start"], date_range["end"])
+            date_range = _date_range(city_config)
+            dates = _dates_between(date_range["start"], date_range["end"])
             city_type = city_config.get("city_type", "event_host")
             logger.info(f"{city_config['name']} ({city_type}): {len(city_config['hotels'])} hotels x {len(dates)} dates = {len(city_config['hotels']) * len(dates)} requests")
         return
 
-    # Memory management: refresh context every N hotels
-    # Reduced to 3 for aggressive memory management after corruption issues
-    REQUESTS_BEFORE_CONTEXT_REFRESH = 3
-    request_count = 0
-
-    with sync_playwright() as p:
-        browser = None
-        context = None
-        page = None
-
-        def launch_browser():
-            """Launch a fresh browser instance."""
-            nonlocal browser
-            return p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-gpu',
-                    '--single-process',
-                    '--disable-extensions',
-                    '--js-flags=--max-old-space-size=512',  # Limit JS heap
-                ]
-            )
-
-        def create_fresh_context():
-            """Create a new browser context with stealth settings."""
-            nonlocal browser, context, page
-
-            # If browser is dead, restart it
-            try:
-                if browser is None or not browser.is_connected():
-                    logger.info("Browser not connected, launching new browser")
-                    browser = launch_browser()
-            except Exception as e:
-                logger.warning(f"Browser check failed, restarting: {e}")
-                try:
-                    if browser:
-                        browser.close()
-                except:
-                    pass
-                browser = launch_browser()
-
-            ctx = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                locale='en-CA',
-                timezone_id='America/Toronto',
-            )
-            pg = ctx.new_page()
-            stealth_sync(pg)
-            return ctx, pg
-
-        browser = launch_browser()
-        context, page = create_fresh_context()
-        logger.debug("Initial browser context created")
-
-        for city_key in cities:
-            city_config = cities_config[city_key]
-            city_name = city_config["name"]
-            city_type = city_config.get("city_type", "event_host")
-
-            logger.info(f"Scraping {city_name} ({city_type})")
-
-            # Support both new (scrape_date_range) and legacy (date_range) schema
-            date_range = city_config.get("scrape_date_range", city_config.get("date_range", {}))
-            dates = generate_dates(date_range["start"], date_range["end"])
-
-            for hotel in city_config["hotels"]:
-                logger.info(f"Hotel: {hotel['name']}")
-
-                # Refresh context periodically to prevent memory leaks
-                request_count += 1
-                if request_count % REQUESTS_BEFORE_CONTEXT_REFRESH == 0:
-                    logger.info(f"Refreshing browser context after {request_count} hotel batches")
-                    # Full browser restart for clean memory state
-                    context = None
-                    browser = None
-                    try:
-                        import subprocess
-                        subprocess.run(['pkill', '-f', 'chromium'], capture_output=True, timeout=5)
-                    except Exception:
-                        pass
-                    time.sleep(2)
-                    browser = launch_browser()
-                    context, page = create_fresh_context()
-                    time.sleep(2)  # Give browser time to stabilize
-
-                for check_in in dates:
-                    # Retry loop for browser corruption recovery
-                    max_corruption_retries = 2
-                    for corruption_retry in range(max_corruption_retries + 1):
-                        try:
-                            result = scrape_hotel_rate(page, hotel, city_name, city_config, event_info, check_in)
-                            break  # Success, exit retry loop
-                        except BrowserCorruptionError as e:
-                            if corruption_retry < max_corruption_retries:
-                                logger.warning(f"Browser corruption on {hotel['name']} {check_in}, refreshing browser (attempt {corruption_retry + 1}/{max_corruption_retries})")
-                                # Don't try to close corrupted browser/context - it can hang
-                                # Just abandon them and launch fresh (GC will clean up)
-                                context = None
-                                browser = None
-                                # Kill any orphaned chromium processes to ensure clean state
-                                try:
-                                    import subprocess
-                                    subprocess.run(['pkill', '-f', 'chromium'], capture_output=True, timeout=5)
-                                except Exception:
-                                    pass
-                                time.sleep(2)
-                                browser = launch_browser()
-                                context, page = create_fresh_context()
-                                logger.info("Browser restarted after corruption")
-                                time.sleep(2)
-                            else:
-                                # Exhausted retries, record error
-                                logger.error(f"Browser corruption persists for {hotel['name']} {check_in} after {max_corruption_retries} restarts")
-                                result = {
-                                    "hotel_id": hotel["id"],
-                                    "hotel_name": hotel["name"],
-                                    "city": city_name,
-                                    "segment": hotel["segment"],
-                                    "venue_proximity": hotel.get("venue_proximity", hotel.get("proximity")),
-                                    "proximity": hotel.get("venue_proximity", hotel.get("proximity")),
-                                    "check_in_date": check_in,
-                                    "check_out_date": (datetime.strptime(check_in, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d"),
-                                    "rate": None,
-                                    "currency": "CAD",
-                                    "availability_status": "error",
-                                    "scrape_timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-                                    "error": str(e),
-                                    "event_id": event_info.get("event_id"),
-                                    "event_type": event_info.get("event_type"),
-                                    "city_type": city_config.get("city_type", "event_host"),
-                                    "control_for": city_config.get("control_for"),
-                                    "days_to_event": None,
-                                    "nearest_event_date": None
-                                }
-
-                    all_results.append(result)
-
-                    if result["error"]:
-                        errors.append({
-                            "hotel": hotel["name"],
-                            "date": check_in,
-                            "error": result["error"]
-                        })
-                        logger.error(f"{hotel['name']} {check_in}: ERROR - {result['error']}")
-                    elif result["rate"]:
-                        logger.info(f"{hotel['name']} {check_in}: ${result['rate']} {result['currency']}")
-                    else:
-                        logger.info(f"{hotel['name']} {check_in}: {result['availability_status']}")
-
-                    # Random delay between requests
-                    delay = random.uniform(
-                        settings["delay_min_seconds"],
-                        settings["delay_max_seconds"]
-                    )
-                    time.sleep(delay)
-
-        # Clean up
-        try:
-            context.close()
-        except Exception:
-            pass
-        browser.close()
-        logger.debug("Browser closed")
+    # Use the GraphQL API first if a SearchQueries document has been captured,
+    # then the plain HTML results page, before rendering in the browser
+    global _graphql_api, _html_fast_path
+    _graphql_api = load_booking_graphql_query() is not None
+    _html_fast_path = settings.get("html_fast_path", False)
+    api_client = None
+    if _graphql_api:
+        logger.info("Booking.com GraphQL API enabled (browser used as fallback)")
+    if _html_fast_path:
+        logger.info("Search results HTML fast path enabled (browser used as fallback)")
+    if _graphql_api or _html_fast_path:
+        api_client = create_api_client()
+
+    # Flatten the sweep into independent (city, hotel, date) tasks
+    tasks = []
+    for city_key in cities:
+        city_config = cities_config[city_key]
+        city_type = city_config.get("city_type", "event_host")
+        date_range = _date_range(city_config)
+        dates = _dates_between(date_range["start"], date_range["end"])
+        logger.info(f"Scraping {city_config['name']} ({city_type}): {len(city_config['hotels'])} hotels x {len(dates)} dates")
+        for hotel in city_config["hotels"]:
+            for check_in in dates:
+                tasks.append((hotel, city_config, check_in))
+
+    if concurrency is None:
+        concurrency = settings.get("max_concurrency", 8)
+    if pool_size is None:
+        pool_size = concurrency
+    logger.info(f"Scraping {len(tasks)} hotel/date pairs with concurrency {concurrency} on {pool_size} contexts")
+
+    results_file = DATA_DIR / CHECKPOINT_DIR_NAME / f"{scrape_timestamp}.ndjson"
+    results_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        await scrape_session(
+            tasks,
+            event_info,
+            settings,
+            concurrency=concurrency,
+            pool_size=pool_size,
+            results_file=results_file,
+            api_client=api_client,
+        )
+    finally:
+        if api_client is not None:
+            await api_client.aclose()
 
-    # Generate session report
-    report = generate_scrape_report(all_results, errors)
+    # Generate session report in one streaming pass over the recorded results
+    offsets = index_results_stream(results_file)
+    errors = []
+    report = generate_scrape_report(
+        collect_errors(iter_results_stream(results_file, tasks, offsets), errors),
+        errors,
+    )
 
-    # Save results
+    # Save results, streaming them from the NDJSON file in task order
     output_file = output_dir / f"scrape_{scrape_timestamp}.json"
-    output_data = {
-        "scrape_metadata": {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-            "event_id": event_info.get("event_id"),
-            "event_name": event_info.get("event_name"),
-            "cities_scraped": cities,
-            "total_results": len(all_results),
-            "errors_count": len(errors)
-        },
-        "results": all_results,
-        "errors": errors,
-        "report": report
+    scrape_metadata = {
+        "timestamp": utc_now_iso(),
+        "event_id": event_info.get("event_id"),
+        "event_name": event_info.get("event_name"),
+        "cities_scraped": cities,
+        "total_results": report["total_requests"],
+        "errors_count": len(errors)
     }
-
-    with open(output_file, "w") as f:
-        json.dump(output_data, f, indent=2)
+    write_scrape_file(
+        output_file,
+        scrape_metadata,
+        iter_results_stream(results_file, tasks, offsets),
+        errors,
+        report,
+    )
 
     # Log session report
     logger.info("=" * 60)
@@ -1074,64 +2359,170 @@ def run_scraper(cities: list[str] = None, event_id: str = "fifa_2026", dry_run:
 
     logger.info(f"Results saved to: {output_file}")
 
-    # Also update the latest.json symlink/copy for dashboard
+    # The full results are on disk, so the resume checkpoint is no longer needed
+    results_file.unlink(missing_ok=True)
+
+    # Also point latest.json at the new scrape file for the dashboard
     latest_file = DATA_DIR / "latest.json"
-    with open(latest_file, "w") as f:
-        json.dump(output_data, f, indent=2)
+    publish_latest(output_file, latest_file)
     logger.info(f"Latest data updated: {latest_file}")
 
     # Update the aggregated data file for the dashboard
     update_aggregated_data()
 
-    return output_data
+    return {
+        "scrape_metadata": scrape_metadata,
+        "output_file": str(output_file),
+        "errors": errors,
+        "report": report
+    }
+
+
+def publish_latest(output_file: Path, latest_file: Path):
+    """
+    Atomically replace latest_file with the contents of output_file.
+
+    Hardlinks a temporary name to output_file and renames it over
+    latest_file, so readers never see a partial file and nothing is
+    re-serialized. Falls back to a byte copy where hardlinks aren't
+    supported.
+    """
+    tmp_file = latest_file.with_suffix(".json.tmp")
+    tmp_file.unlink(missing_ok=True)
+    try:
+        os.link(output_file, tmp_file)
+    except OSError as e:
+        logger.debug(f"Hardlink failed ({type(e).__name__}: {e}), copying {output_file.name}")
+        shutil.copyfile(output_file, tmp_file)
+    os.replace(tmp_file, latest_file)
+
+
+def _parse_scrape_file(item: tuple[str, Path]) -> dict | None:
+    """Load one scrape file into an aggregated entry (runs in worker processes).
+
+    Returns None when the file can't be read or isn't a scrape object, so
+    one corrupt file doesn't abort the whole aggregation.
+    """
+    scrape_date, scrape_file = item
+    try:
+        data = read_json(scrape_file)
+        if not isinstance(data, dict):
+            return None
+    except (OSError, ValueError):
+        return None
+    return {
+        "scrape_date": scrape_date,
+        "file": scrape_file.name,
+        "metadata": data.get("scrape_metadata", {}),
+        "results": data.get("results", [])
+    }
 
 
-def update_aggregated_data():
+def update_aggregated_data(full_rescan: bool = False):
     """
-    Aggregate all historical scrape data into a single file for the dashboard.
+    Aggregate all historical scrape data for the dashboard.
     This allows the dashboard to show trends over time.
+
+    Each scrape (with its results) is one line of aggregated.ndjson, so new
+    scrapes are appended without re-reading old ones. aggregated.json is a
+    small index of the scrapes in that file. A full rebuild happens when
+    full_rescan is set or the index/NDJSON pair is missing or unusable
+    (including a pre-NDJSON aggregated.json).
+
+    Args:
+        full_rescan: Rebuild from every scrape file instead of appending
     """
-    all_scrapes = []
-
-    # Find all scrape files
-    for date_dir in sorted(DATA_DIR.iterdir()):
-        if date_dir.is_dir() and re.match(r'\d{4}-\d{2}-\d{2}', date_dir.name):
-            for scrape_file in sorted(date_dir.glob("scrape_*.json")):
-                with open(scrape_file, "r") as f:
-                    data = json.load(f)
-                    all_scrapes.append({
-                        "scrape_date": date_dir.name,
-                        "file": scrape_file.name,
-                        "metadata": data.get("scrape_metadata", {}),
-                        "results": data.get("results", [])
-                    })
-
-    # Save aggregated data
     aggregated_file = DATA_DIR / "aggregated.json"
-    with open(aggregated_file, "w") as f:
-        json.dump({
-            "last_updated": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-            "total_scrapes": len(all_scrapes),
-            "scrapes": all_scrapes
-        }, f, indent=2)
+    ndjson_file = DATA_DIR / AGGREGATED_NDJSON_NAME
 
-    logger.info(f"Aggregated data updated: {aggregated_file}")
+    index = []
+    if not full_rescan and aggregated_file.exists() and ndjson_file.exists():
+        try:
+            existing = read_json(aggregated_file)
+            if existing.get("data_file") == AGGREGATED_NDJSON_NAME:
+                index = existing["scrapes"]
+            else:
+                full_rescan = True
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Could not reuse {aggregated_file}, rebuilding: {type(e).__name__}: {e}")
+            full_rescan = True
+    else:
+        full_rescan = True
+    ingested = {(s["scrape_date"], s["file"]) for s in index}
+
+    # Collect scrape files not yet aggregated, oldest first
+    pending = []
+    date_dirs = sorted(
+        (e for e in os.scandir(DATA_DIR) if e.is_dir() and DATE_DIR_RE.match(e.name)),
+        key=lambda e: e.name,
+    )
+    for date_dir in date_dirs:
+        scrape_names = sorted(
+            f.name for f in os.scandir(date_dir.path)
+            if f.name.startswith("scrape_") and f.name.endswith(".json")
+        )
+        for name in scrape_names:
+            if (date_dir.name, name) not in ingested:
+                pending.append((date_dir.name, Path(date_dir.path, name)))
+
+    # Parse in worker processes for large batches (e.g. --rebuild); this
+    # process stays the only writer and map() keeps the files in order.
+    # Everything is parsed before either file is touched, so a bad scrape
+    # file can't leave the NDJSON and the index out of step
+    executor = None
+    if len(pending) >= AGGREGATE_PARALLEL_MIN_FILES:
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+    try:
+        parsed = list(executor.map(_parse_scrape_file, pending, chunksize=4) if executor else map(_parse_scrape_file, pending))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    entries = []
+    for (scrape_date, scrape_file), entry in zip(pending, parsed):
+        if entry is None:
+            logger.warning(f"Skipping unreadable scrape file {scrape_date}/{scrape_file.name}")
+            continue
+        entries.append(entry)
+    new_count = len(entries)
+
+    # A rebuild goes to a temp file that replaces the old NDJSON only once
+    # it's complete; incremental runs append
+    data_target = ndjson_file.with_name(ndjson_file.name + ".tmp") if full_rescan else ndjson_file
+    with open(data_target, "wb" if full_rescan else "ab") as f:
+        for entry in entries:
+            f.write(json_line(entry))
+            index.append({k: entry[k] for k in ("scrape_date", "file", "metadata")})
+    if full_rescan:
+        os.replace(data_target, ndjson_file)
+
+    # Save the index the dashboard reads first, swapped in atomically
+    index_tmp = aggregated_file.with_name(aggregated_file.name + ".tmp")
+    write_json(index_tmp, {
+        "last_updated": utc_now_iso(),
+        "total_scrapes": len(index),
+        "data_file": AGGREGATED_NDJSON_NAME,
+        "scrapes": index
+    })
+    os.replace(index_tmp, aggregated_file)
+
+    logger.info(f"Aggregated data updated: {ndjson_file} ({new_count} new scrape(s), {len(index)} total)")
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
 
 
 def main():
     """Main entry point."""
-    import argparse
-
-    # Load config to get available cities
-    config = load_config()
-    cities_config = get_event_cities(config, "fifa_2026")
-    available_cities = list(cities_config.keys())
-
     parser = argparse.ArgumentParser(description="PitchPrice Hotel Rate Scraper")
     parser.add_argument(
         "--cities",
         nargs="+",
-        help=f"Cities to scrape (available: {', '.join(available_cities)}). Default: all"
+        help="Cities to scrape (city keys from the event's config). Default: all"
     )
     parser.add_argument(
         "--event",
@@ -1143,16 +2534,60 @@ def main():
         action="store_true",
         help="Print what would be scraped without actually scraping"
     )
+    parser.add_argument(
+        "--rebuild", "--rebuild-aggregate",
+        action="store_true",
+        help="Rebuild aggregated.json from every scrape file and exit"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="TIMESTAMP",
+        help="Resume an interrupted scrape from data/scrapes/checkpoints/<TIMESTAMP>.ndjson"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        help="Maximum hotel/date pairs scraped at once (default: max_concurrency from config)"
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=positive_int,
+        help="Maximum browser contexts open at once (default: same as --concurrency)"
+    )
 
     args = parser.parse_args()
 
-    # Validate cities if provided
+    if args.rebuild:
+        update_aggregated_data(full_rescan=True)
+        return
+
+    if args.resume:
+        try:
+            datetime.strptime(args.resume, SCRAPE_TIMESTAMP_FORMAT)
+        except ValueError:
+            parser.error(f"Invalid --resume timestamp {args.resume!r}, expected YYYYMMDD_HHMMSS")
+        if not (DATA_DIR / CHECKPOINT_DIR_NAME / f"{args.resume}.ndjson").exists():
+            parser.error(f"No checkpoint found for {args.resume}")
+
+    # Validate cities if provided, against the chosen event's config
     if args.cities:
-        invalid = [c for c in args.cities if c not in available_cities]
+        try:
+            cities_config = get_event_cities(load_config(), args.event)
+        except ValueError as e:
+            parser.error(str(e))
+        # cities_config is keyed by city, so membership is a hash lookup
+        invalid = [c for c in args.cities if c not in cities_config]
         if invalid:
-            parser.error(f"Invalid cities: {', '.join(invalid)}. Available: {', '.join(available_cities)}")
-
-    run_scraper(cities=args.cities, event_id=args.event, dry_run=args.dry_run)
+            parser.error(f"Invalid cities: {', '.join(invalid)}. Available: {', '.join(cities_config)}")
+
+    run_scraper(
+        cities=args.cities,
+        event_id=args.event,
+        dry_run=args.dry_run,
+        concurrency=args.concurrency,
+        pool_size=args.pool_size,
+        resume=args.resume,
+    )
 
 
 if __name__ == "__main__":